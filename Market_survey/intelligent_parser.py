@@ -31,12 +31,17 @@ Guarantees
 
 import os
 import json
+import re
+from functools import lru_cache
 from typing import Any, Dict, List, Optional
 
 from dotenv import load_dotenv
 from langchain_openai import ChatOpenAI
 
 
+# Compiled once at import; matching a fenced block is a single search
+_FENCE_PATTERN = re.compile(r"```(?:json)?\s*(.*?)\s*```", re.DOTALL | re.IGNORECASE)
+
 # Target schema enforced by the parser
 REACT_SCHEMA_KEYS = ("core_idea", "domain", "key_features", "target_audience")
 
@@ -48,11 +53,14 @@ REACT_SCHEMA_DESCRIPTION = {
 }
 
 
+@lru_cache(maxsize=1)
 def _build_llm() -> ChatOpenAI:
     """Construct a ChatOpenAI client using environment configuration.
 
     Loads `.env`, reads the API key and model, and optionally sets a base URL
     for providers like OpenRouter when the API key starts with `sk-or-`.
+    The client is built once and cached, so repeated parses reuse its
+    underlying HTTP session instead of re-running the TLS handshake.
 
     Returns:
         ChatOpenAI: A configured LLM client ready for invocation.
@@ -114,10 +122,7 @@ def _strip_code_fences(text: str) -> str:
     Handles blocks like ```json ... ``` or ``` ... ``` and returns the inner
     content. If no fences are found, returns the input unchanged.
     """
-    import re
-
-    fence_pattern = re.compile(r"```(?:json)?\s*(.*?)\s*```", re.DOTALL | re.IGNORECASE)
-    match = fence_pattern.search(text)
+    match = _FENCE_PATTERN.search(text)
     if match:
         return match.group(1).strip()
     return text
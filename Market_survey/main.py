@@ -1,5 +1,7 @@
+import json
 import os
 import re
+import sys
 import time
 import argparse
 from typing import Dict, List, Tuple
@@ -13,6 +15,41 @@ from prompt_template import build_react_agent_prompt_template_v2
 from data_loader import load_startups_profile, load_funding_rounds, load_market_news, get_field, find_name
 
 
+# Static report sections emitted verbatim by offline_generate_report;
+# built once at import so each call extends with shared tuples instead
+# of re-appending the same literals line by line
+_RISKS_SECTION = (
+    "## Risks & Mitigations",
+    "- Supply chain reliability for biodegradable materials; mitigate via diversified sourcing.",
+    "- Compatibility variability across machine models; mitigate via rigorous testing for top devices.",
+    "- Price sensitivity vs. sustainable premium; mitigate via subscription bundles.",
+    "- Regulatory/standards claims for compostability; mitigate via certification.",
+    "- Brand awareness vs. incumbents; mitigate via partnerships.",
+    "",
+)
+_OPPORTUNITIES_SECTION = (
+    "## Opportunities & Go-to-Market",
+    "- Partner with eco-conscious coffee brands and retailers.",
+    "- Subscription model with recycling/return incentives.",
+    "- Target workplaces and universities with sustainability initiatives.",
+    "",
+)
+_KPI_SECTION = (
+    "## Financial & Traction KPIs to Watch",
+    "- Monthly active subscribers, repeat purchase rate, churn.",
+    "- Gross margin per pod, blended CAC, LTV.",
+    "- Recycling return rate, certification coverage.",
+    "- Distribution partnerships signed.",
+    "- Complaint rate by machine compatibility.",
+    "- Unit economics by channel.",
+    "",
+)
+_RECOMMENDATION_SECTION = (
+    "## Final Recommendation",
+    "- Proceed with focused pilot targeting top compatible machines and green retailers; validate pricing and subscription uptake. Expand with certified claims and partnerships.",
+)
+
+
 def build_llm() -> ChatOpenAI:
     load_dotenv()
     model = os.getenv("OPENAI_MODEL", "gpt-4o-mini")
@@ -68,7 +105,6 @@ def _normalize_action_input(action_input: str) -> str:
 
     Accepts JSON like {"query": "..."} or {"name": "..."}, otherwise returns raw string.
     """
-    import json
     try:
         obj = json.loads(action_input)
         if isinstance(obj, dict):
@@ -188,9 +224,8 @@ def offline_generate_report(input_json_str: str) -> str:
     This avoids LLM calls when rate limits are active. It performs simple keyword matching
     against startup profiles, funding rounds, and news to approximate the requested sections.
     """
-    import json as _json
     try:
-        data = _json.loads(input_json_str)
+        data = json.loads(input_json_str)
     except Exception:
         data = {}
 
@@ -297,32 +332,25 @@ def offline_generate_report(input_json_str: str) -> str:
     else:
         lines.append("- No recent relevant news found in datasets via keyword matching.")
     lines.append("")
-    lines.append("## Risks & Mitigations")
-    lines.append("- Supply chain reliability for biodegradable materials; mitigate via diversified sourcing.")
-    lines.append("- Compatibility variability across machine models; mitigate via rigorous testing for top devices.")
-    lines.append("- Price sensitivity vs. sustainable premium; mitigate via subscription bundles.")
-    lines.append("- Regulatory/standards claims for compostability; mitigate via certification.")
-    lines.append("- Brand awareness vs. incumbents; mitigate via partnerships.")
-    lines.append("")
-    lines.append("## Opportunities & Go-to-Market")
-    lines.append("- Partner with eco-conscious coffee brands and retailers.")
-    lines.append("- Subscription model with recycling/return incentives.")
-    lines.append("- Target workplaces and universities with sustainability initiatives.")
-    lines.append("")
-    lines.append("## Financial & Traction KPIs to Watch")
-    lines.append("- Monthly active subscribers, repeat purchase rate, churn.")
-    lines.append("- Gross margin per pod, blended CAC, LTV.")
-    lines.append("- Recycling return rate, certification coverage.")
-    lines.append("- Distribution partnerships signed.")
-    lines.append("- Complaint rate by machine compatibility.")
-    lines.append("- Unit economics by channel.")
-    lines.append("")
-    lines.append("## Final Recommendation")
-    lines.append("- Proceed with focused pilot targeting top compatible machines and green retailers; validate pricing and subscription uptake. Expand with certified claims and partnerships.")
+    lines.extend(_RISKS_SECTION)
+    lines.extend(_OPPORTUNITIES_SECTION)
+    lines.extend(_KPI_SECTION)
+    lines.extend(_RECOMMENDATION_SECTION)
 
     return "\n".join(lines)
 
 
+def _emit_report(result: str) -> None:
+    """Write the framed report block with a single stdout write.
+
+    One buffered write replaces three print calls and their per-line
+    syscalls, which matters on slow terminals and piped output.
+    """
+    sys.stdout.write(
+        f"\n===== Market Intelligence Report =====\n\n{result}\n\n=====================================\n\n"
+    )
+
+
 def main():
     parser = argparse.ArgumentParser(description="Market Survey AI Agent (ReAct)")
     parser.add_argument("--name", type=str, help="Startup name to analyze (non-interactive mode)")
@@ -335,9 +363,7 @@ def main():
     if args.idea_json:
         print("Running ReAct with provided idea JSON...\n")
         result = react_generate_report(llm, args.idea_json)
-        print("\n===== Market Intelligence Report =====\n")
-        print(result)
-        print("\n=====================================\n")
+        _emit_report(result)
         return
 
     if args.idea:
@@ -347,29 +373,23 @@ def main():
         if result.startswith("Final Answer: Iteration limit"):
             print("\nLLM rate limit or iteration cap reached; running offline dataset-only synthesis...\n")
             result = offline_generate_report(parsed_json_str)
-        print("\n===== Market Intelligence Report =====\n")
-        print(result)
-        print("\n=====================================\n")
+        _emit_report(result)
         return
 
     if args.name:
         print("Preparing input JSON and running ReAct...\n")
         # Build a minimal JSON input when only a name is provided
-        import json as _json
-        minimal = _json.dumps({
+        minimal = json.dumps({
             "core_idea": f"Analyze startup: {args.name}",
             "domain": "startup analysis",
             "key_features": [args.name],
             "target_audience": "stakeholders"
         }, ensure_ascii=False)
         result = react_generate_report(llm, minimal)
-        print("\n===== Market Intelligence Report =====\n")
-        print(result)
-        print("\n=====================================\n")
+        _emit_report(result)
         return
 
-    print("Market Survey AI Agent (ReAct)\n")
-    print("Enter a startup name to analyze. Press Ctrl+C to quit.\n")
+    sys.stdout.write("Market Survey AI Agent (ReAct)\n\nEnter a startup name to analyze. Press Ctrl+C to quit.\n\n")
     try:
         while True:
             name = input("Startup name or paste an idea: ").strip()
@@ -378,21 +398,18 @@ def main():
                 continue
             print("\nRunning ReAct...\n")
             # Detect if input seems like an idea (multi-sentence)
-            import json as _json
             if len(name.split()) > 4:
                 parsed_json_str = parse_business_idea(name)
                 result = react_generate_report(llm, parsed_json_str)
             else:
-                minimal = _json.dumps({
+                minimal = json.dumps({
                     "core_idea": f"Analyze startup: {name}",
                     "domain": "startup analysis",
                     "key_features": [name],
                     "target_audience": "stakeholders"
                 }, ensure_ascii=False)
                 result = react_generate_report(llm, minimal)
-            print("\n===== Market Intelligence Report =====\n")
-            print(result)
-            print("\n=====================================\n")
+            _emit_report(result)
     except KeyboardInterrupt:
         print("\nGoodbye!")
 
@@ -0,0 +1,71 @@
+"""
+Competitor Table Module for Market Intelligence Research Agent.
+
+This module provides a columnar view over competitor records so that
+single-field scans don't pay a dict lookup per row.
+"""
+from typing import Any, Dict, List, Tuple
+
+
+class CompetitorTable(list):
+    """
+    List of competitor dictionaries with lazily cached column views.
+
+    Behaves exactly like the raw list it replaces (iteration, len, JSON
+    serialization), but repeated single-field scans read a parallel tuple
+    built once instead of doing per-row dict access on every pass.
+    """
+
+    # The column cache is the only extra attribute; slots drop the
+    # per-instance __dict__ the subclass would otherwise add on top of
+    # the list payload
+    __slots__ = ("_columns",)
+
+    def __init__(self, records: List[Dict[str, Any]] = ()):
+        super().__init__(records)
+        self._columns: Dict[str, Tuple[Any, ...]] = {}
+
+    @classmethod
+    def from_dicts(cls, records: List[Dict[str, Any]]) -> "CompetitorTable":
+        """
+        Build a table from raw competitor dictionaries.
+
+        Args:
+            records: List of competitor dictionaries
+
+        Returns:
+            CompetitorTable wrapping the records
+        """
+        return cls(records)
+
+    def _column(self, key: str, default: Any) -> Tuple[Any, ...]:
+        """Return the cached column for a field, building it on first use."""
+        column = self._columns.get(key)
+        if column is None:
+            column = self._columns[key] = tuple(comp.get(key, default) for comp in self)
+        return column
+
+    @property
+    def names(self) -> Tuple[str, ...]:
+        """Company name per row."""
+        return self._column("name", "Unknown")
+
+    @property
+    def audiences(self) -> Tuple[str, ...]:
+        """Target audience per row."""
+        return self._column("audience", "N/A")
+
+    @property
+    def usps(self) -> Tuple[str, ...]:
+        """Unique selling proposition per row."""
+        return self._column("usp", "N/A")
+
+    @property
+    def features_joined(self) -> Tuple[str, ...]:
+        """Comma-joined feature list per row, computed once."""
+        column = self._columns.get("features_joined")
+        if column is None:
+            column = self._columns["features_joined"] = tuple(
+                ", ".join(comp.get("features", ["N/A"])) for comp in self
+            )
+        return column
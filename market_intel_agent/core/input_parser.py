@@ -3,10 +3,63 @@ Input Parser Module for Market Intelligence Research Agent.
 
 This module is responsible for parsing user input (startup idea) into structured JSON format.
 """
+import hashlib
 import json
 import os
+import re
+import sys
+import threading
+from collections import OrderedDict
 from typing import Dict, List, Any, Optional
 
+
+# Parsed results keyed by a hash of the normalized idea text; retries
+# and reruns of the same input skip the parse entirely. Shared across
+# instances and bounded with least-recently-used eviction.
+_PARSE_CACHE = OrderedDict()
+_PARSE_CACHE_LOCK = threading.Lock()
+_PARSE_CACHE_MAX = 128
+
+# The key doesn't change during the process lifetime, so the environment
+# is consulted once at import instead of per construction
+_DEFAULT_LLM_API_KEY = os.environ.get("LLM_API_KEY")
+
+
+# Domain keywords for simple rule-based matching
+_DOMAIN_KEYWORDS = {
+    "health": ["health", "medical", "wellness", "fitness", "menstrual"],
+    "finance": ["finance", "banking", "investment", "money", "payment", "fintech", "stock trading", "trading", "stocks"],
+    "education": ["education", "learning", "teaching", "school", "course"],
+    "e-commerce": ["e-commerce", "shop", "retail", "store", "marketplace"],
+    "social": ["social", "community", "network", "connect", "share"]
+}
+
+# One union alternation over every domain keyword, compiled once at
+# import, with one named group per domain; a single C-level scan finds
+# all keyword hits and match.lastgroup names the owning domain directly,
+# with no per-keyword lookup. Group names can't contain hyphens, so
+# "e-commerce" maps through an underscored alias.
+_DOMAIN_RE = re.compile(
+    "|".join(
+        "(?P<{}>{})".format(
+            domain.replace("-", "_"),
+            "|".join(re.escape(keyword) for keyword in keywords),
+        )
+        for domain, keywords in _DOMAIN_KEYWORDS.items()
+    ),
+    re.IGNORECASE,
+)
+
+# (group name, domain) in declaration order; ties between domains still
+# resolve to the one declared first. Labels like "e-commerce" don't
+# qualify for CPython's automatic interning, so they are interned here:
+# every parse result shares one string object per domain and downstream
+# dict lookups keyed on it short-circuit on identity.
+_DOMAIN_PRIORITY = tuple(
+    (domain.replace("-", "_"), sys.intern(domain)) for domain in _DOMAIN_KEYWORDS
+)
+
+
 class IntelligentInputParser:
     """
     Parses plain-English startup idea into structured JSON format.
@@ -20,7 +73,7 @@ class IntelligentInputParser:
         Args:
             llm_api_key: API key for the language model service (e.g., OpenAI)
         """
-        self.llm_api_key = llm_api_key or os.environ.get("LLM_API_KEY")
+        self.llm_api_key = llm_api_key or _DEFAULT_LLM_API_KEY
         
     def parse(self, idea_text: str) -> Dict[str, Any]:
         """
@@ -34,15 +87,46 @@ class IntelligentInputParser:
         """
         # In a production system, this would call an LLM API
         # For now, we'll implement a simple rule-based parser
-        
+
+        key = hashlib.blake2b(idea_text.strip().encode('utf-8'), digest_size=16).digest()
+        with _PARSE_CACHE_LOCK:
+            cached = _PARSE_CACHE.get(key)
+            if cached is not None:
+                _PARSE_CACHE.move_to_end(key)
+                return self._copy_parsed(cached)
+
         # Example implementation (to be replaced with actual LLM call)
         parsed_data = self._simple_parse(idea_text)
-        
+
         # Validate the parsed data
         self._validate_parsed_data(parsed_data)
-        
+
+        with _PARSE_CACHE_LOCK:
+            _PARSE_CACHE[key] = self._copy_parsed(parsed_data)
+            if len(_PARSE_CACHE) > _PARSE_CACHE_MAX:
+                _PARSE_CACHE.popitem(last=False)
+
         return parsed_data
     
+    @staticmethod
+    def _copy_parsed(data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Copy a parse result, including its nested feature list.
+
+        A shallow dict copy alone would share key_features between the
+        cache and callers, letting a caller's mutation corrupt every
+        later parse of the same idea.
+
+        Args:
+            data: Parse result to copy
+
+        Returns:
+            Independent copy safe to hand out or cache
+        """
+        copied = dict(data)
+        copied["key_features"] = list(data["key_features"])
+        return copied
+
     def _simple_parse(self, idea_text: str) -> Dict[str, Any]:
         """
         Simple rule-based parsing for demonstration purposes.
@@ -63,30 +147,26 @@ class IntelligentInputParser:
             "target_audience": ""
         }
         
-        # Extract domain (simple keyword matching)
-        domains = {
-            "health": ["health", "medical", "wellness", "fitness", "menstrual"],
-            "finance": ["finance", "banking", "investment", "money", "payment", "fintech", "stock trading", "trading", "stocks"],
-            "education": ["education", "learning", "teaching", "school", "course"],
-            "e-commerce": ["e-commerce", "shop", "retail", "store", "marketplace"],
-            "social": ["social", "community", "network", "connect", "share"]
-        }
-        
-        # Find domain based on keywords
-        for domain, keywords in domains.items():
-            if any(keyword in idea_text.lower() for keyword in keywords):
-                parsed_data["domain"] = domain
-                break
+        # One pass over the text collects the matched group names; the
+        # domain declared first in _DOMAIN_KEYWORDS still wins ties
+        hits = {match.lastgroup for match in _DOMAIN_RE.finditer(idea_text)}
+        if hits:
+            for group, domain in _DOMAIN_PRIORITY:
+                if group in hits:
+                    parsed_data["domain"] = domain
+                    break
         
         # Extract core idea (first sentence)
         sentences = idea_text.split('.')
         if sentences:
             parsed_data["core_idea"] = sentences[0].strip()
         
-        # Extract key features (look for words after "with" or "features")
-        if "with" in idea_text:
-            features_text = idea_text.split("with")[1]
-            features = [f.strip() for f in features_text.split("and")]
+        # Extract key features (look for words after "with" or "features");
+        # a single bounded split replaces the membership test plus full
+        # split, so the text is scanned once instead of twice
+        parts = idea_text.split("with", 2)
+        if len(parts) > 1:
+            features = [f.strip() for f in parts[1].split("and")]
             parsed_data["key_features"] = features
         
         # In a real implementation, we would use more sophisticated NLP techniques
@@ -4,10 +4,37 @@ Output Formatter Module for Market Intelligence Research Agent.
 This module formats the synthesized report into Markdown or HTML format.
 """
 from typing import Dict, List, Any, Optional
+from functools import lru_cache
 import os
-import markdown
+import string
 import json
 
+
+@lru_cache(maxsize=32)
+def domain_slug(domain: str) -> str:
+    """Return the filename-safe slug for a domain, computed once each."""
+    return domain.lower().replace(' ', '_')
+
+# Precompile the HTML boilerplate once at import time so each report only
+# pays for the `$content` substitution, not a full template rebuild.
+_TEMPLATE_PATH = os.path.join(os.path.dirname(__file__), "templates", "report_template.html")
+with open(_TEMPLATE_PATH, "r") as _f:
+    _HTML_TEMPLATE = string.Template(_f.read())
+
+# Row template for the confidence appendix table, compiled to a format
+# spec once at import rather than per row
+_CONF_ROW = "| {} | {:.2f} |"
+
+# Report sections in render order; the title is only used to build the
+# placeholder text when a section is missing from the report data.
+_SECTIONS = (
+    ("executive_summary", "Executive Summary"),
+    ("competitor_landscape", "Competitor Landscape"),
+    ("funding_analysis", "Funding Analysis"),
+    ("swot_analysis", "SWOT Analysis"),
+    ("market_trends", "Market Trends"),
+)
+
 class OutputFormatter:
     """
     Formats the synthesized report into Markdown or HTML format.
@@ -40,7 +67,7 @@ class OutputFormatter:
         """
         # Generate report filename based on domain
         domain = parsed_input.get("domain", "market")
-        filename = f"{domain.lower().replace(' ', '_')}_market_report"
+        filename = f"{domain_slug(domain)}_market_report"
         
         # Combine report sections
         markdown_content = self._combine_sections(report_data)
@@ -50,8 +77,11 @@ class OutputFormatter:
         with open(md_path, "w") as f:
             f.write(markdown_content)
         
-        # If HTML output is requested, convert markdown to HTML
+        # If HTML output is requested, convert markdown to HTML; the
+        # converter is only imported on this branch so markdown-only runs
+        # skip its import cost entirely
         if output_format.lower() == "html":
+            import markdown
             html_content = markdown.markdown(markdown_content)
             html_path = os.path.join(self.output_dir, f"{filename}.html")
             with open(html_path, "w") as f:
@@ -60,6 +90,33 @@ class OutputFormatter:
         
         return md_path
     
+    def stream_report(self, report_data: Dict[str, Any], out: Any,
+                      output_format: str = "markdown") -> None:
+        """
+        Write the report directly to an open stream, section by section.
+
+        Avoids holding the full report string in memory; each markdown
+        section is written as soon as it is available.
+
+        Args:
+            report_data: Dictionary containing report sections
+            out: Writable text stream
+            output_format: Output format (markdown or html)
+        """
+        if output_format.lower() == "html":
+            # Markdown-to-HTML conversion needs the whole document, so this
+            # format still materializes the combined sections once; the
+            # converter import is deferred to this branch too
+            import markdown
+            html_content = markdown.markdown(self._combine_sections(report_data))
+            out.write(self._wrap_html(html_content))
+            return
+
+        for key, title in _SECTIONS:
+            out.write(report_data[key] if key in report_data else f"# {title}\n\nNo data available.")
+            out.write("\n\n")
+        out.write(self._format_confidence_appendix(report_data.get("confidence_scores", {})))
+
     def _combine_sections(self, report_data: Dict[str, Any]) -> str:
         """
         Combine report sections into a single markdown document.
@@ -71,14 +128,11 @@ class OutputFormatter:
             Combined markdown content
         """
         sections = [
-            report_data.get("executive_summary", "# Executive Summary\n\nNo data available."),
-            report_data.get("competitor_landscape", "# Competitor Landscape\n\nNo data available."),
-            report_data.get("funding_analysis", "# Funding Analysis\n\nNo data available."),
-            report_data.get("swot_analysis", "# SWOT Analysis\n\nNo data available."),
-            report_data.get("market_trends", "# Market Trends\n\nNo data available."),
-            self._format_confidence_appendix(report_data.get("confidence_scores", {}))
+            report_data[key] if key in report_data else f"# {title}\n\nNo data available."
+            for key, title in _SECTIONS
         ]
-        
+        sections.append(self._format_confidence_appendix(report_data.get("confidence_scores", {})))
+
         return "\n\n".join(sections)
     
     def _format_confidence_appendix(self, confidence_scores: Dict[str, float]) -> str:
@@ -94,15 +148,20 @@ class OutputFormatter:
         if not confidence_scores:
             return "# Confidence Appendix\n\nNo confidence data available."
         
-        # Create confidence table
-        table_header = "| Section | Confidence Score |\n| --- | --- |\n"
-        table_rows = ""
-        
-        for section, score in confidence_scores.items():
-            if section != "overall_confidence":
-                section_name = section.replace("_", " ").title()
-                table_rows += f"| {section_name} | {score:.2f} |\n"
-        
+        # Create confidence table; one join allocates the row block once
+        # instead of growing a string per row. Without any per-section
+        # scores a message replaces the table rather than emitting a
+        # header with an empty body.
+        rows = [
+            _CONF_ROW.format(section.replace("_", " ").title(), score)
+            for section, score in confidence_scores.items()
+            if section != "overall_confidence"
+        ]
+        if rows:
+            table = "| Section | Confidence Score |\n| --- | --- |\n" + "\n".join(rows) + "\n"
+        else:
+            table = "No per-section confidence data available.\n"
+
         overall = confidence_scores.get("overall_confidence", 0.0)
         
         appendix = f"""
@@ -110,7 +169,7 @@ class OutputFormatter:
 
 This appendix provides confidence scores for different sections of the report, indicating the reliability of the data and analysis.
 
-{table_header}{table_rows}
+{table}
 
 **Overall Confidence Score: {overall:.2f}**
 
@@ -129,47 +188,4 @@ This appendix provides confidence scores for different sections of the report, i
         Returns:
             Complete HTML document
         """
-        return f"""<!DOCTYPE html>
-<html>
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Market Intelligence Report</title>
-    <style>
-        body {{
-            font-family: Arial, sans-serif;
-            line-height: 1.6;
-            max-width: 800px;
-            margin: 0 auto;
-            padding: 20px;
-        }}
-        h1, h2, h3 {{
-            color: #2c3e50;
-        }}
-        table {{
-            border-collapse: collapse;
-            width: 100%;
-            margin: 20px 0;
-        }}
-        th, td {{
-            border: 1px solid #ddd;
-            padding: 8px;
-            text-align: left;
-        }}
-        th {{
-            background-color: #f2f2f2;
-        }}
-        img {{
-            max-width: 100%;
-            height: auto;
-        }}
-        .confidence-score {{
-            font-weight: bold;
-            color: #3498db;
-        }}
-    </style>
-</head>
-<body>
-    {html_content}
-</body>
-</html>"""
\ No newline at end of file
+        return _HTML_TEMPLATE.substitute(content=html_content)
\ No newline at end of file
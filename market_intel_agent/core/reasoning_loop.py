@@ -3,29 +3,84 @@ Reasoning Loop Module for Market Intelligence Research Agent.
 
 This module implements the ReAct (Reasoning, Acting, Observing) loop for autonomous research.
 """
-from typing import Dict, List, Any, Callable, Optional
+from typing import Dict, List, Any, Callable, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from hashlib import blake2b
 import json
 import time
 import yaml
 import os
 
+from core.competitor_table import CompetitorTable
+
+# Immutable system prompt, rendered once per run. Keeping the prefix
+# byte-identical across iterations lets an LLM backend reuse its KV cache
+# for everything before the per-step delta entries.
+_SYSTEM_PROMPT = (
+    "You are a market intelligence research agent. Analyze the startup idea "
+    "below and decide which research tool to call next.\n"
+    "Idea: {core_idea}\n"
+    "Domain: {domain}\n"
+    "Key features: {key_features}\n\n"
+)
+
+# Bit assigned to each data category in the collection-state mask
+_TOOL_BITS = {
+    "CompetitorFinder": 1,
+    "FundingRetriever": 2,
+    "WebSearchTool": 4,
+    "RAGQueryTool": 8,
+}
+
+# Which collected_data bucket each tool writes, and which tools produce
+# free-text results that get deduped and embedded at ingestion
+_DATA_KEYS = {
+    "CompetitorFinder": "competitors",
+    "FundingRetriever": "funding_data",
+    "WebSearchTool": "web_search_results",
+    "RAGQueryTool": "rag_results",
+}
+_TEXT_RESULT_TOOLS = frozenset({"WebSearchTool", "RAGQueryTool"})
+
+
+def _thought_for_mask(mask: int) -> Tuple[str, str]:
+    """Thought category and template for a given collection-state mask."""
+    if not mask & 1:
+        return ("competitors", "I need to find competitors in the {domain} domain")
+    if not mask & 2:
+        return ("funding", "I should retrieve funding data for the identified competitors")
+    if not mask & 4:
+        return ("web", "I need to search for market trends in {domain}")
+    if not mask & 8:
+        return ("rag", "I should query the rag system for additional context")
+    return ("done", "I have collected sufficient data for analysis")
+
+
+# Precomputed thought lookup, indexed directly by the state mask
+_THOUGHT_TABLE = tuple(_thought_for_mask(m) for m in range(16))
+
+
 class ReasoningLoop:
     """
     Implements the ReAct (Reasoning, Acting, Observing) loop for autonomous market research.
     Maintains working memory and manages tool calls in an iterative process.
     """
     
-    def __init__(self, tools: Dict[str, Callable], max_iterations: int = 10, config_path: str = "configs/model_config.yaml"):
+    def __init__(self, tools: Dict[str, Callable], max_iterations: int = 10, config_path: str = "configs/model_config.yaml",
+                 embedder: Optional[Any] = None):
         """
         Initialize the reasoning loop with available tools.
-        
+
         Args:
             tools: Dictionary mapping tool names to tool functions
             max_iterations: Maximum number of reasoning iterations
             config_path: Path to the model configuration file
+            embedder: Optional sentence encoder; when given, web/RAG
+                snippets are embedded in one batch as they are collected
         """
         self.tools = tools
         self.max_iterations = max_iterations
+        self.embedder = embedder
         
         # Load fallback configuration
         self.config = self._load_config(config_path)
@@ -33,10 +88,40 @@ class ReasoningLoop:
         self.fallback_threshold = self.config.get('fallback', {}).get('fallback_confidence_threshold', 0.6)
         self.max_fallback_attempts = self.config.get('fallback', {}).get('max_fallback_attempts', 2)
         
+        # Bitmask tracking which data categories have been collected; kept
+        # in sync with collected_data by _update_collected_data
+        self._state_mask = 0
+
+        # Content hashes of web/RAG results already collected, so fallback
+        # queries and overlapping sources don't feed duplicates downstream
+        self._seen_hashes = set()
+
+        # Cached prompt prefix and per-step delta log for the LLM backend;
+        # only the deltas grow between iterations
+        self._prompt_prefix = ""
+        self._delta_log = []
+
+        # Tool responses keyed by (tool, args hash); re-planned calls
+        # with identical arguments in one session skip the tool entirely
+        self._tool_cache = {}
+
+        # Thought category -> action builder, resolved once instead of
+        # substring-matching the thought prose on every iteration
+        self._action_dispatch = {
+            "competitors": self._build_competitor_action,
+            "funding": self._build_funding_action,
+            "web": self._build_web_action,
+            "rag": self._build_rag_action,
+            "done": self._build_noop_action,
+        }
+
+        # Thought/action/observation slots are preallocated and filled by
+        # index, so the hot path never pays list-resize copies; run()
+        # trims the unused tail before returning
         self.working_memory = {
-            "thoughts": [],
-            "actions": [],
-            "observations": [],
+            "thoughts": [None] * max_iterations,
+            "actions": [None] * max_iterations,
+            "observations": [None] * max_iterations,
             "fallback_attempts": 0,
             "collected_data": {
                 "competitors": [],
@@ -67,132 +152,223 @@ class ReasoningLoop:
         Returns:
             Working memory with all collected data
         """
-        iteration = 0
-        
         # Store parsed_input in working memory for downstream actions
         self.working_memory["parsed_input"] = parsed_input
-        
-        while iteration < self.max_iterations:
-            # Generate thought
-            thought = self._generate_thought(parsed_input, self.working_memory)
-            self.working_memory["thoughts"].append(thought)
-            
-            # Determine next action
-            action, tool_name, tool_args = self._determine_action(thought, self.working_memory)
-            self.working_memory["actions"].append({
+
+        # Render the immutable prompt prefix once per run
+        self._prompt_prefix = _SYSTEM_PROMPT.format(
+            core_idea=parsed_input.get("core_idea", ""),
+            domain=parsed_input.get("domain", ""),
+            key_features=", ".join(parsed_input.get("key_features", [])),
+        )
+        self._delta_log = []
+
+        thoughts = self.working_memory["thoughts"]
+        actions = self.working_memory["actions"]
+        observations = self.working_memory["observations"]
+        step = 0
+        obs_index = 0
+
+        # Phase 1: CompetitorFinder runs alone because the funding lookup
+        # depends on the company names it produces. A zero iteration
+        # budget leaves the preallocated columns empty and skips the
+        # phase entirely, as the original bounded loop did.
+        if self.max_iterations > 0:
+            category, thought = self._generate_thought(parsed_input, self.working_memory)
+            thoughts[step] = thought
+
+            action, tool_name, tool_args = self._determine_action(category, self.working_memory)
+            actions[step] = {
                 "tool": tool_name,
                 "args": tool_args,
                 "timestamp": time.time()
-            })
-            
-            # Execute action
+            }
+            step += 1
+
             if tool_name in self.tools:
                 observation = self._execute_tool(tool_name, tool_args)
-                self.working_memory["observations"].append(observation)
-                
-                # Store results in the appropriate category
+                observations[obs_index] = observation
+                obs_index += 1
                 self._update_collected_data(tool_name, observation)
-                
-                # Check if fallback is needed based on observation quality
-                if self.use_fallback and self._needs_fallback(tool_name, observation):
-                    fallback_observation = self._execute_fallback(parsed_input, tool_name)
-                    if fallback_observation:
-                        self.working_memory["observations"].append(fallback_observation)
-                        self._update_collected_data("WebSearchTool", fallback_observation if isinstance(fallback_observation, list) else [fallback_observation])
-                        self.working_memory["fallback_attempts"] += 1
+                self._log_step(thought, tool_name, observation)
             else:
-                self.working_memory["observations"].append(f"Error: Tool '{tool_name}' not found")
-            
-            # Check if we have enough data to stop
-            if self._should_stop():
-                break
-                
-            iteration += 1
-            
+                observations[obs_index] = f"Error: Tool '{tool_name}' not found"
+                obs_index += 1
+
+        # Phase 2: funding, web search and RAG are data-independent, so
+        # dispatch them concurrently and merge observations once all resolve.
+        plan = self._plan_remaining(parsed_input, step)
+        if plan:
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                futures = []
+                for thought, tool_name, tool_args in plan:
+                    thoughts[step] = thought
+                    actions[step] = {
+                        "tool": tool_name,
+                        "args": tool_args,
+                        "timestamp": time.time()
+                    }
+                    step += 1
+                    if tool_name in self.tools:
+                        futures.append((thought, tool_name, executor.submit(self._execute_tool, tool_name, tool_args)))
+                    else:
+                        futures.append((thought, tool_name, None))
+
+                for thought, tool_name, future in futures:
+                    if future is None:
+                        observations[obs_index] = f"Error: Tool '{tool_name}' not found"
+                        obs_index += 1
+                        continue
+                    observation = future.result()
+                    observations[obs_index] = observation
+                    obs_index += 1
+                    self._update_collected_data(tool_name, observation)
+                    self._log_step(thought, tool_name, observation)
+
+                    # Check if fallback is needed based on observation quality
+                    if self.use_fallback and self._needs_fallback(tool_name, observation):
+                        fallback_observation = self._execute_fallback(parsed_input, tool_name)
+                        if fallback_observation:
+                            # Fallbacks can push past the preallocated slots
+                            if obs_index < len(observations):
+                                observations[obs_index] = fallback_observation
+                            else:
+                                observations.append(fallback_observation)
+                            obs_index += 1
+                            self._update_collected_data("WebSearchTool", fallback_observation if isinstance(fallback_observation, list) else [fallback_observation])
+                            self.working_memory["fallback_attempts"] += 1
+
+        # Trim the preallocated slots that were not used this run
+        self.working_memory["thoughts"] = thoughts[:step]
+        self.working_memory["actions"] = actions[:step]
+        self.working_memory["observations"] = observations[:obs_index]
+
         return self.working_memory
-    
-    def _generate_thought(self, parsed_input: Dict[str, Any], memory: Dict[str, Any]) -> str:
+
+    def _plan_remaining(self, parsed_input: Dict[str, Any], steps_used: int = 0) -> List[Tuple[str, str, Dict[str, Any]]]:
+        """
+        Plan the remaining tool calls from the current working memory.
+
+        By this point CompetitorFinder has already run, so funding retrieval,
+        web search and RAG queries have no dependencies on each other and
+        can safely execute in parallel.
+
+        Args:
+            parsed_input: Structured input data
+            steps_used: Number of reasoning steps already taken
+
+        Returns:
+            List of (thought, tool name, tool arguments) tuples
+        """
+        domain = parsed_input.get("domain", "")
+        mask = self._state_mask
+        plan = []
+
+        if mask & 1 and not mask & 2:
+            competitors = self.working_memory["collected_data"]["competitors"]
+            company_names = list(competitors.names) if isinstance(competitors, CompetitorTable) \
+                else [comp["name"] for comp in competitors]
+            plan.append((
+                "I should retrieve funding data for the identified competitors",
+                "FundingRetriever",
+                {"companies": company_names}
+            ))
+        if not mask & 4:
+            plan.append((
+                f"I need to search for market trends in {domain}",
+                "WebSearchTool",
+                {"query": f"{domain} market trends 2023", "num_results": 5}
+            ))
+        if not mask & 8:
+            plan.append((
+                "I should query the rag system for additional context",
+                "RAGQueryTool",
+                {"query": f"{domain} startup success factors"}
+            ))
+
+        # Respect the iteration budget that the sequential loop enforced
+        budget = max(0, self.max_iterations - steps_used)
+        return plan[:budget]
+
+    def _generate_thought(self, parsed_input: Dict[str, Any], memory: Dict[str, Any]) -> Tuple[str, str]:
         """
         Generate the next thought based on current state.
         In a production system, this would use an LLM.
-        
+
         Args:
             parsed_input: Structured input data
             memory: Current working memory
-            
+
         Returns:
-            Thought string
+            Tuple of (thought category, thought string)
         """
         # In production, this would call an LLM API
-        # For now, implement a simple rule-based system
-        
-        collected_data = memory["collected_data"]
+        # For now, pick the template matching the collection-state mask
+
         domain = parsed_input.get('domain', 'startup')
-        
-        if not collected_data["competitors"]:
-            return f"I need to find competitors in the {domain} domain"
-        elif not collected_data["funding_data"] and collected_data["competitors"]:
-            return "I should retrieve funding data for the identified competitors"
-        elif not collected_data["web_search_results"]:
-            return f"I need to search for market trends in {domain}"
-        elif not collected_data["rag_results"]:
-            return "I should query the rag system for additional context"
-        else:
-            return "I have collected sufficient data for analysis"
-    
-    def _determine_action(self, thought: str, memory: Dict[str, Any]) -> tuple:
+        category, template = _THOUGHT_TABLE[self._state_mask]
+        return category, template.format(domain=domain)
+
+    def _determine_action(self, category: str, memory: Dict[str, Any]) -> tuple:
         """
-        Determine the next action based on the current thought.
-        
+        Determine the next action for a thought category.
+
         Args:
-            thought: Current thought
+            category: Thought category from _generate_thought
             memory: Current working memory
-            
+
         Returns:
             Tuple of (action description, tool name, tool arguments)
         """
         # In production, this would use an LLM to determine the action
-        # For now, implement a simple rule-based system
-        
+        # For now, dispatch directly on the category decided by the thought
+
+        handler = self._action_dispatch.get(category, self._build_noop_action)
+        return handler(memory)
+
+    def _build_competitor_action(self, memory: Dict[str, Any]) -> tuple:
         parsed_input = memory.get("parsed_input", {})
-        
-        if "find competitors" in thought.lower():
-            return (
-                "Search for competitors",
-                "CompetitorFinder",
-                {"domain": parsed_input.get("domain", ""), "features": parsed_input.get("key_features", [])}
-            )
-        elif "funding data" in thought.lower():
-            competitors = memory["collected_data"]["competitors"]
-            company_names = [comp["name"] for comp in competitors] if competitors else []
-            return (
-                "Retrieve funding data",
-                "FundingRetriever",
-                {"companies": company_names}
-            )
-        elif "search for market" in thought.lower():
-            domain = parsed_input.get("domain", "")
-            query = f"{domain} market trends 2023"
-            return (
-                "Web search for market trends",
-                "WebSearchTool",
-                {"query": query, "num_results": 5}
-            )
-        elif "query the rag" in thought.lower():
-            domain = parsed_input.get("domain", "")
-            query = f"{domain} startup success factors"
-            return (
-                "RAG query for domain knowledge",
-                "RAGQueryTool",
-                {"query": query}
-            )
+        return (
+            "Search for competitors",
+            "CompetitorFinder",
+            {"domain": parsed_input.get("domain", ""), "features": parsed_input.get("key_features", [])}
+        )
+
+    def _build_funding_action(self, memory: Dict[str, Any]) -> tuple:
+        competitors = memory["collected_data"]["competitors"]
+        if isinstance(competitors, CompetitorTable):
+            company_names = list(competitors.names)
         else:
-            return (
-                "No action needed",
-                "NoOp",
-                {}
-            )
-    
+            company_names = [comp["name"] for comp in competitors] if competitors else []
+        return (
+            "Retrieve funding data",
+            "FundingRetriever",
+            {"companies": company_names}
+        )
+
+    def _build_web_action(self, memory: Dict[str, Any]) -> tuple:
+        domain = memory.get("parsed_input", {}).get("domain", "")
+        return (
+            "Web search for market trends",
+            "WebSearchTool",
+            {"query": f"{domain} market trends 2023", "num_results": 5}
+        )
+
+    def _build_rag_action(self, memory: Dict[str, Any]) -> tuple:
+        domain = memory.get("parsed_input", {}).get("domain", "")
+        return (
+            "RAG query for domain knowledge",
+            "RAGQueryTool",
+            {"query": f"{domain} startup success factors"}
+        )
+
+    def _build_noop_action(self, memory: Dict[str, Any]) -> tuple:
+        return (
+            "No action needed",
+            "NoOp",
+            {}
+        )
+
     def _update_collected_data(self, tool_name: str, observation: Any) -> None:
         """
         Update the collected data based on tool results.
@@ -201,15 +377,104 @@ class ReasoningLoop:
             tool_name: Name of the tool that was called
             observation: Result from the tool call
         """
-        if tool_name == "CompetitorFinder":
-            self.working_memory["collected_data"]["competitors"] = observation
-        elif tool_name == "FundingRetriever":
-            self.working_memory["collected_data"]["funding_data"] = observation
-        elif tool_name == "WebSearchTool":
-            self.working_memory["collected_data"]["web_search_results"] = observation
-        elif tool_name == "RAGQueryTool":
-            self.working_memory["collected_data"]["rag_results"] = observation
-    
+        # One mapping lookup picks the bucket; the nested dict is
+        # resolved once instead of per branch
+        data_key = _DATA_KEYS.get(tool_name)
+        if data_key is not None:
+            if isinstance(observation, list):
+                if tool_name == "CompetitorFinder":
+                    # Columnar wrapper so downstream single-field scans are cheap
+                    observation = CompetitorTable.from_dicts(observation)
+                elif tool_name in _TEXT_RESULT_TOOLS:
+                    observation = self._dedupe_results(observation)
+                    self._embed_results(observation)
+            self.working_memory["collected_data"][data_key] = observation
+
+        # Mark the category as collected only when the tool returned data,
+        # matching the truthiness checks _should_stop used to perform
+        bit = _TOOL_BITS.get(tool_name)
+        if bit and observation:
+            self._state_mask |= bit
+
+    def _dedupe_results(self, results: List[Any]) -> List[Any]:
+        """
+        Drop results whose snippet/content has already been collected.
+
+        Web search and RAG queries often return overlapping items; one
+        8-byte content hash per result keeps the filter O(n).
+
+        Args:
+            results: List of result dictionaries
+
+        Returns:
+            List with previously seen results removed
+        """
+        unique = []
+        seen = self._seen_hashes
+        for result in results:
+            if isinstance(result, dict):
+                text = result.get("snippet") or result.get("content") or str(result)
+            else:
+                text = str(result)
+            digest = blake2b(text.encode("utf-8"), digest_size=8).digest()
+            if digest not in seen:
+                seen.add(digest)
+                unique.append(result)
+        return unique
+
+    def _embed_results(self, results: List[Any]) -> None:
+        """
+        Attach snippet embeddings to results in one batched encoder call.
+
+        Embedding at ingestion means downstream consumers (semantic cache,
+        re-ranking, clustering) never re-encode per pass, and one batch
+        amortizes the per-call model overhead.
+
+        Args:
+            results: List of result dictionaries, mutated in place
+        """
+        if self.embedder is None or not results:
+            return
+
+        dict_results = [r for r in results if isinstance(r, dict)]
+        if not dict_results:
+            return
+
+        texts = [r.get("snippet") or r.get("content") or "" for r in dict_results]
+        try:
+            embeddings = self.embedder.encode(texts, batch_size=64, convert_to_numpy=True)
+        except Exception as e:
+            print(f"Error embedding results: {str(e)}")
+            return
+        for result, embedding in zip(dict_results, embeddings):
+            result["_emb"] = embedding
+
+    def _log_step(self, thought: str, tool_name: str, observation: Any) -> None:
+        """
+        Append one thought/action/observation entry to the prompt delta log.
+
+        Args:
+            thought: Thought that led to the action
+            tool_name: Tool that was executed
+            observation: Result of the tool call
+        """
+        step = len(self._delta_log) + 1
+        self._delta_log.append(
+            f"Thought {step}: {thought}\nAction {step}: {tool_name}\nObservation {step}: {observation}"
+        )
+
+    def _render_prompt(self) -> str:
+        """
+        Build the full LLM prompt: cached prefix plus the step deltas.
+
+        The prefix is byte-identical across calls within a run, so a
+        serving backend with prompt caching only prefills the deltas.
+
+        Returns:
+            Complete prompt string
+        """
+        return self._prompt_prefix + "\n".join(self._delta_log)
+
     def _should_stop(self) -> bool:
         """
         Determine if we have collected enough data to stop the loop.
@@ -217,16 +482,8 @@ class ReasoningLoop:
         Returns:
             Boolean indicating whether to stop the loop
         """
-        # Check if we have data in all categories
-        collected_data = self.working_memory["collected_data"]
-        
-        has_competitors = len(collected_data["competitors"]) > 0
-        has_funding = bool(collected_data["funding_data"])
-        has_web_results = len(collected_data["web_search_results"]) > 0
-        has_rag_results = len(collected_data["rag_results"]) > 0
-        
         # We need at least competitors, funding data, and either web results or RAG results
-        return has_competitors and has_funding and (has_web_results or has_rag_results)
+        return (self._state_mask & 3) == 3 and bool(self._state_mask & 12)
     
     def get_working_memory(self) -> Dict[str, Any]:
         """
@@ -244,19 +501,34 @@ class ReasoningLoop:
         tool = self.tools.get(tool_name)
         if not tool:
             return f"Error: Tool '{tool_name}' not found"
+
+        # Identical calls within a session return the cached response
+        cache_key = (
+            tool_name,
+            blake2b(json.dumps(tool_args, sort_keys=True, default=str).encode("utf-8"),
+                    digest_size=8).digest(),
+        )
+        cached = self._tool_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         try:
             if tool_name == "CompetitorFinder":
-                return tool.find_competitors(**tool_args)
+                result = tool.find_competitors(**tool_args)
             elif tool_name == "FundingRetriever":
-                return tool.get_funding_data(**tool_args)
+                result = tool.get_funding_data(**tool_args)
             elif tool_name == "WebSearchTool":
-                return tool.search(**tool_args)
+                result = tool.search(**tool_args)
             elif tool_name == "RAGQueryTool":
-                return tool.query(**tool_args)
+                result = tool.query(**tool_args)
             else:
                 return f"Error: Unsupported tool '{tool_name}'"
         except Exception as e:
             return f"Error executing {tool_name}: {e}"
+
+        # Errors are never cached; only successful responses are reused
+        self._tool_cache[cache_key] = result
+        return result
     
     def _needs_fallback(self, tool_name: str, observation: Any) -> bool:
         """
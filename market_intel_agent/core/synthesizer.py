@@ -4,8 +4,255 @@ Synthesizer Module for Market Intelligence Research Agent.
 This module aggregates collected data and generates a comprehensive market report.
 """
 from typing import Dict, List, Any, Optional
+from collections import OrderedDict
+from functools import lru_cache
+from string import Template
+import hashlib
 import json
 import os
+import random
+
+try:
+    import jinja2
+except ImportError:
+    jinja2 = None
+
+from core.competitor_table import CompetitorTable
+
+# The key doesn't change during the process lifetime, so the environment
+# is consulted once at import instead of per construction
+_DEFAULT_LLM_API_KEY = os.environ.get("LLM_API_KEY")
+
+# SWOT phrase templates, built once at import time. The helpers below
+# sample from these independently per call so the two bullets a section
+# draws for the same slot usually differ.
+_STRENGTH_TMPL = (
+    "Unique approach to {d} with focus on user experience",
+    "Innovative integration of {f} technologies",
+    "Strong potential for network effects in {d} space",
+)
+
+_WEAKNESS_TMPL = (
+    "Limited initial brand recognition in {d} market",
+    "Potential high customer acquisition costs in {d} space",
+    "Technical complexity of implementing all planned features",
+)
+
+_OPPORTUNITY_TMPL = (
+    "Growing {d} market with increasing user adoption",
+    "Untapped international markets for {d} solutions",
+    "Integration possibilities with complementary {d} services",
+)
+
+_THREAT_TMPL = (
+    "Rapid technological changes in {d} landscape",
+    "Potential for larger tech companies to enter {d} space",
+    "Price competition from established players",
+)
+
+
+# Section templates, parsed once at import time and rendered with
+# format_map so each report only pays for placeholder substitution
+_EXEC_SUMMARY_TMPL = """\
+# Executive Summary
+
+This market intelligence report analyzes the viability of a new startup in the {domain} domain.
+The core business idea is: {core_idea}.
+
+Our analysis identified {num_competitors} established competitors in this space, with varying levels of
+funding and market penetration. The overall market shows {health}
+health, with {trend} in recent investment activity.
+
+Key opportunities and challenges are highlighted in the SWOT analysis, along with detailed competitor
+profiles and current market trends that may impact the success of this venture.\
+"""
+
+_LANDSCAPE_TMPL = """\
+# Competitor Landscape
+
+The following table summarizes the key competitors in this market space:
+
+{table_header}{table_rows}
+
+## Competitive Positioning
+
+Based on the competitor analysis, the market shows {competition_level}
+level of competition with {differentiation} differentiation between offerings.\
+"""
+
+_SWOT_TMPL = """\
+# SWOT Analysis
+
+## Strengths
+- {strength_a}
+- Innovative approach to {domain} challenges
+- {strength_b}
+
+## Weaknesses
+- New entrant in an established market
+- {weakness}
+- Potential scaling challenges in {domain} space
+
+## Opportunities
+- {opportunity_a}
+- Underserved segments within {domain} market
+- {opportunity_b}
+
+## Threats
+- Established competitors with market share
+- {threat}
+- Regulatory changes in {domain} industry\
+"""
+
+
+# Row template for the competitor table, compiled to a format spec once
+# at import rather than per row
+_COMP_ROW = "| {} | {} | {} | {} |"
+
+# Funding section parsed into a Template once at import; each report
+# only substitutes the JSON-serialized funding dict. json.dumps beats
+# embedding a dict repr and yields valid literal syntax in the snippet.
+_FUNDING_TMPL = Template("""\
+# Funding Analysis
+
+## Investment Trends
+
+The following chart shows the funding received by key competitors:
+
+```python
+import matplotlib.pyplot as plt
+
+funding = $data  # in millions USD
+
+plt.figure(figsize=(10, 6))
+plt.bar(list(funding), list(funding.values()), color='skyblue')
+plt.title('Competitor Funding Comparison')
+plt.xlabel('Company')
+plt.ylabel('Total Funding (Millions USD)')
+plt.xticks(rotation=45)
+plt.tight_layout()
+plt.savefig('reports/funding_chart.png')
+plt.close()
+```
+
+## Funding Rounds Analysis
+
+Recent funding activity suggests investor confidence in this market space, with an average
+of $$X million raised across Y funding rounds in the past 24 months.\
+""")
+
+# Sample figures used when the collected payloads carry no totals
+_SAMPLE_FUNDING = {"CompA": 5.2, "CompB": 3.8, "CompC": 7.1, "CompD": 2.5}
+
+
+def _funding_totals(funding_data: Any) -> Dict[str, float]:
+    """Flatten funding payloads into {company: total funding in $M}."""
+    totals = {}
+    entries = funding_data if isinstance(funding_data, list) else [funding_data]
+    for entry in entries:
+        if not isinstance(entry, dict):
+            continue
+        for company, info in entry.get("companies", {}).items():
+            if isinstance(info, dict):
+                totals[company] = round(info.get("total_funding", 0) / 1e6, 2)
+    return totals
+
+
+def _market_bucket(n_competitors: int) -> int:
+    """Bucket a competitor count: 0 (<=2), 1 (3-5), 2 (>5)."""
+    return 0 if n_competitors <= 2 else 1 if n_competitors <= 5 else 2
+
+
+# (competitor bucket, has funding) -> (market health, competition level,
+# funding trend), precomputed for all six market states
+_MARKET_STATE_TABLE = {
+    (n, f): (
+        "strong" if n == 2 and f else "moderate" if n >= 1 else "emerging",
+        ("a low", "a moderate", "a high")[n],
+        "an upward trend",
+    )
+    for n in (0, 1, 2)
+    for f in (0, 1)
+}
+
+
+def _market_state(n_competitors: int, has_funding: bool) -> tuple:
+    """Look up (health, competition level, trend) for a market state."""
+    return _MARKET_STATE_TABLE[(_market_bucket(n_competitors), int(has_funding))]
+
+
+def _pick_strength(domain: str, features: tuple) -> str:
+    f = ", ".join(features[:2]) if features else domain
+    return random.choice(_STRENGTH_TMPL).format(d=domain, f=f)
+
+
+def _pick_weakness(domain: str) -> str:
+    return random.choice(_WEAKNESS_TMPL).format(d=domain)
+
+
+def _pick_opportunity(domain: str) -> str:
+    return random.choice(_OPPORTUNITY_TMPL).format(d=domain)
+
+
+def _pick_threat(domain: str) -> str:
+    return random.choice(_THREAT_TMPL).format(d=domain)
+
+
+@lru_cache(maxsize=256)
+def _swot_body(domain: str, features: tuple) -> str:
+    """Render the full SWOT section for a (domain, features) pair.
+
+    Phrases are sampled when a pair is first rendered and the finished
+    section is cached, so repeat domains skip the picks and the template
+    substitution while the two bullets per slot stay independent draws.
+    """
+    return _SWOT_TMPL.format_map({
+        "domain": domain,
+        "strength_a": _pick_strength(domain, features),
+        "strength_b": _pick_strength(domain, features),
+        "weakness": _pick_weakness(domain),
+        "opportunity_a": _pick_opportunity(domain),
+        "opportunity_b": _pick_opportunity(domain),
+        "threat": _pick_threat(domain),
+    })
+
+
+# Synthesis is deterministic for a given parse result and collected data, so
+# repeat analyses of the same idea can be served straight from cache. The key
+# is a digest of both rather than the objects themselves, since working
+# memory is mutable between runs. Bounded with least-recently-used
+# eviction so long-running sessions don't accumulate stale reports.
+_SYNTH_CACHE: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+_SYNTH_CACHE_MAX = 128
+
+
+def _copy_report(report: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy a report dict, including its nested confidence scores.
+
+    A shallow copy alone would share the confidence_scores dict between
+    the cache and callers, letting a caller's mutation corrupt every
+    later cache hit. Section values are plain strings and safe to share.
+    """
+    copied = dict(report)
+    scores = copied.get("confidence_scores")
+    if scores is not None:
+        copied["confidence_scores"] = dict(scores)
+    return copied
+
+
+def _synth_cache_key(parsed_input: Dict[str, Any], collected_data: Dict[str, Any]) -> str:
+    """Build a stable cache key from the parse result and collected data."""
+    idea = json.dumps(
+        [
+            parsed_input.get("domain", ""),
+            parsed_input.get("core_idea", ""),
+            parsed_input.get("key_features", []),
+        ],
+        sort_keys=True,
+    )
+    data = json.dumps(collected_data, sort_keys=True, default=str)
+    return hashlib.sha1((idea + "\x00" + data).encode("utf-8")).hexdigest()
+
 
 class Synthesizer:
     """
@@ -20,7 +267,17 @@ class Synthesizer:
         Args:
             llm_api_key: API key for the language model service (e.g., OpenAI)
         """
-        self.llm_api_key = llm_api_key or os.environ.get("LLM_API_KEY")
+        self.llm_api_key = llm_api_key or _DEFAULT_LLM_API_KEY
+
+        # Jinja2 compiles each template to bytecode once and keeps it
+        # cached; fall back to the format_map string templates without it
+        self._exec_template = None
+        if jinja2 is not None:
+            env = jinja2.Environment(
+                loader=jinja2.FileSystemLoader(os.path.join(os.path.dirname(__file__), "templates")),
+                cache_size=-1,
+            )
+            self._exec_template = env.get_template("exec_summary.j2")
     
     def synthesize(self, working_memory: Dict[str, Any], parsed_input: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -33,6 +290,18 @@ class Synthesizer:
         Returns:
             Dictionary containing the synthesized report sections
         """
+        # Serve repeat analyses of the same idea + data from cache
+        cache_key = _synth_cache_key(parsed_input, working_memory["collected_data"])
+        cached = _SYNTH_CACHE.get(cache_key)
+        if cached is not None:
+            _SYNTH_CACHE.move_to_end(cache_key)
+            return _copy_report(cached)
+
+        # Destructure parsed_input once; the generators take concrete args
+        domain = parsed_input.get("domain", "")
+        core_idea = parsed_input.get("core_idea", "")
+        features = parsed_input.get("key_features", [])
+
         # Extract relevant data from working memory
         competitors = working_memory["collected_data"]["competitors"]
         funding_data = working_memory["collected_data"]["funding_data"]
@@ -43,81 +312,71 @@ class Synthesizer:
         
         # In a production system, this would call an LLM API with a prompt
         # For now, we'll implement a template-based approach
-        
-        # Generate report sections
-        executive_summary = self._generate_executive_summary(parsed_input, competitors, funding_data)
-        competitor_landscape = self._generate_competitor_landscape(competitors)
-        funding_analysis = self._generate_funding_analysis(funding_data)
-        swot_analysis = self._generate_swot_analysis(parsed_input, competitors, web_search_results)
-        market_trends = self._generate_market_trends(web_search_results, rag_results)
-        
-        # Generate new sections if data is available
-        financial_overview = None
-        recent_headlines = None
-        
-        if finance_data:
-            financial_overview = self._generate_financial_overview(finance_data)
-        
-        if news_results:
-            recent_headlines = self._generate_recent_headlines(news_results)
-        
-        # Combine into final report
+
+        # Score first, so degenerate or low-confidence inputs can skip
+        # section generation entirely; OutputFormatter fills in placeholders
+        # for any missing section keys
+        confidence_scores = self._generate_confidence_scores(working_memory)
+
         report = {
-            "executive_summary": executive_summary,
-            "competitor_landscape": competitor_landscape,
-            "funding_analysis": funding_analysis
+            "executive_summary": self._generate_executive_summary(domain, core_idea, competitors, funding_data)
         }
-        
+
+        if competitors:
+            report["competitor_landscape"] = self._generate_competitor_landscape(competitors)
+
+        if funding_data:
+            report["funding_analysis"] = self._generate_funding_analysis(funding_data)
+
         # Add optional sections if data is available
-        if financial_overview:
-            report["financial_overview"] = financial_overview
-            
-        if recent_headlines:
-            report["recent_headlines"] = recent_headlines
-            
-        # Add remaining sections
-        report.update({
-            "swot_analysis": swot_analysis,
-            "market_trends": market_trends,
-            "confidence_scores": self._generate_confidence_scores(working_memory)
-        })
-        
+        if finance_data:
+            report["financial_overview"] = self._generate_financial_overview(finance_data)
+
+        if news_results:
+            report["recent_headlines"] = self._generate_recent_headlines(news_results)
+
+        report["swot_analysis"] = self._generate_swot_analysis(domain, features, competitors, web_search_results)
+
+        if (web_search_results or rag_results) and confidence_scores.get("market_trends", 0.0) >= 0.3:
+            report["market_trends"] = self._generate_market_trends(web_search_results, rag_results)
+
+        report["confidence_scores"] = confidence_scores
+
+        _SYNTH_CACHE[cache_key] = _copy_report(report)
+        if len(_SYNTH_CACHE) > _SYNTH_CACHE_MAX:
+            _SYNTH_CACHE.popitem(last=False)
+
         return report
     
-    def _generate_executive_summary(self, parsed_input: Dict[str, Any], 
-                                   competitors: List[Dict[str, Any]], 
+    def _generate_executive_summary(self, domain: str, core_idea: str,
+                                   competitors: List[Dict[str, Any]],
                                    funding_data: Dict[str, Any]) -> str:
         """
         Generate the executive summary section.
-        
+
         Args:
-            parsed_input: Original parsed input
+            domain: Startup domain
+            core_idea: Core business idea
             competitors: List of competitor data
             funding_data: Funding data for competitors
-            
+
         Returns:
             Executive summary text
         """
-        domain = parsed_input.get("domain", "")
-        core_idea = parsed_input.get("core_idea", "")
         num_competitors = len(competitors)
-        
-        # Simple template-based summary
-        summary = f"""
-# Executive Summary
+        health, _, trend = _market_state(num_competitors, bool(funding_data))
 
-This market intelligence report analyzes the viability of a new startup in the {domain} domain. 
-The core business idea is: {core_idea}.
-
-Our analysis identified {num_competitors} established competitors in this space, with varying levels of 
-funding and market penetration. The overall market shows {self._get_market_health(competitors, funding_data)} 
-health, with {self._get_funding_trend(funding_data)} in recent investment activity.
-
-Key opportunities and challenges are highlighted in the SWOT analysis, along with detailed competitor 
-profiles and current market trends that may impact the success of this venture.
-        """
-        
-        return summary.strip()
+        # Simple template-based summary
+        context = {
+            "domain": domain,
+            "core_idea": core_idea,
+            "num_competitors": num_competitors,
+            "health": health,
+            "trend": trend,
+        }
+        if self._exec_template is not None:
+            return self._exec_template.render(context).strip()
+        return _EXEC_SUMMARY_TMPL.format_map(context)
     
     def _generate_competitor_landscape(self, competitors: List[Dict[str, Any]]) -> str:
         """
@@ -132,32 +391,37 @@ profiles and current market trends that may impact the success of this venture.
         if not competitors:
             return "# Competitor Landscape\n\nNo direct competitors were identified in this market space."
         
-        # Create competitor table
+        # Create competitor table; a single join avoids quadratic string
+        # copying when the competitor list is long
         table_header = "| Company | Key Features | Target Audience | USP |\n| --- | --- | --- | --- |\n"
-        table_rows = ""
-        
-        for comp in competitors:
-            name = comp.get("name", "Unknown")
-            features = ", ".join(comp.get("features", ["N/A"]))
-            audience = comp.get("audience", "N/A")
-            usp = comp.get("usp", "N/A")
-            
-            table_rows += f"| {name} | {features} | {audience} | {usp} |\n"
-        
-        landscape = f"""
-# Competitor Landscape
-
-The following table summarizes the key competitors in this market space:
-
-{table_header}{table_rows}
-
-## Competitive Positioning
+        # A CompetitorTable exposes cached column tuples, so the row loop
+        # zips over contiguous columns with no per-cell dict lookup; raw
+        # dict lists fall back to per-row gets
+        if isinstance(competitors, CompetitorTable):
+            rows = zip(
+                competitors.names,
+                competitors.features_joined,
+                competitors.audiences,
+                competitors.usps,
+            )
+        else:
+            rows = (
+                (
+                    comp.get('name', 'Unknown'),
+                    ', '.join(comp.get('features', ['N/A'])),
+                    comp.get('audience', 'N/A'),
+                    comp.get('usp', 'N/A'),
+                )
+                for comp in competitors
+            )
+        table_rows = "\n".join(_COMP_ROW.format(*row) for row in rows) + "\n"
 
-Based on the competitor analysis, the market shows {self._get_competition_level(competitors)} 
-level of competition with {self._get_differentiation_level(competitors)} differentiation between offerings.
-        """
-        
-        return landscape.strip()
+        return _LANDSCAPE_TMPL.format_map({
+            "table_header": table_header,
+            "table_rows": table_rows,
+            "competition_level": _market_state(len(competitors), False)[1],
+            "differentiation": self._get_differentiation_level(competitors),
+        })
     
     def _generate_funding_analysis(self, funding_data: Dict[str, Any]) -> str:
         """
@@ -171,89 +435,31 @@ level of competition with {self._get_differentiation_level(competitors)} differe
         """
         if not funding_data:
             return "# Funding Analysis\n\nNo funding data available for competitors in this space."
-        
-        # In a real implementation, this would include code to generate charts
-        # For now, we'll include placeholder code
-        
-        funding_analysis = """
-# Funding Analysis
-
-## Investment Trends
-
-The following chart shows the funding received by key competitors:
-
-```python
-import matplotlib.pyplot as plt
-import numpy as np
-
-# Sample data - in production this would use actual funding_data
-companies = ['CompA', 'CompB', 'CompC', 'CompD']
-funding = [5.2, 3.8, 7.1, 2.5]  # in millions USD
-
-plt.figure(figsize=(10, 6))
-plt.bar(companies, funding, color='skyblue')
-plt.title('Competitor Funding Comparison')
-plt.xlabel('Company')
-plt.ylabel('Total Funding (Millions USD)')
-plt.xticks(rotation=45)
-plt.tight_layout()
-plt.savefig('reports/funding_chart.png')
-plt.close()
-```
 
-## Funding Rounds Analysis
-
-Recent funding activity suggests investor confidence in this market space, with an average 
-of $X million raised across Y funding rounds in the past 24 months.
-        """
-        
-        return funding_analysis.strip()
+        # Embed the actual collected totals in the chart snippet; the
+        # sample figures only back mock flows that carry no totals
+        totals = _funding_totals(funding_data) or _SAMPLE_FUNDING
+        return _FUNDING_TMPL.substitute(data=json.dumps(totals))
     
-    def _generate_swot_analysis(self, parsed_input: Dict[str, Any],
+    def _generate_swot_analysis(self, domain: str, features: List[str],
                                competitors: List[Dict[str, Any]],
                                web_search_results: List[Dict[str, Any]]) -> str:
         """
         Generate the SWOT analysis section.
-        
+
         Args:
-            parsed_input: Original parsed input
+            domain: Startup domain
+            features: Key features of the startup idea
             competitors: List of competitor data
             web_search_results: Results from web search
-            
+
         Returns:
             SWOT analysis text
         """
-        domain = parsed_input.get("domain", "")
-        features = parsed_input.get("key_features", [])
-        
         # In a production system, this would use an LLM to generate a proper SWOT
         # For now, we'll use a template with some basic logic
-        
-        swot = f"""
-# SWOT Analysis
-
-## Strengths
-- {self._get_random_strength(domain, features)}
-- Innovative approach to {domain} challenges
-- {self._get_random_strength(domain, features)}
 
-## Weaknesses
-- New entrant in an established market
-- {self._get_random_weakness(domain)}
-- Potential scaling challenges in {domain} space
-
-## Opportunities
-- {self._get_random_opportunity(domain, web_search_results)}
-- Underserved segments within {domain} market
-- {self._get_random_opportunity(domain, web_search_results)}
-
-## Threats
-- Established competitors with market share
-- {self._get_random_threat(domain, competitors)}
-- Regulatory changes in {domain} industry
-        """
-        
-        return swot.strip()
+        return _swot_body(domain, tuple(features))
     
     def _generate_market_trends(self, web_search_results: List[Dict[str, Any]],
                                rag_results: List[Dict[str, Any]]) -> str:
@@ -317,72 +523,21 @@ of $X million raised across Y funding rounds in the past 24 months.
     
     def _get_market_health(self, competitors: List[Dict[str, Any]], funding_data: Dict[str, Any]) -> str:
         """Determine market health based on competitors and funding."""
-        if len(competitors) > 5 and funding_data:
-            return "strong"
-        elif len(competitors) > 2:
-            return "moderate"
-        else:
-            return "emerging"
-    
+        return _market_state(len(competitors), bool(funding_data))[0]
+
     def _get_funding_trend(self, funding_data: Dict[str, Any]) -> str:
         """Determine funding trend based on funding data."""
-        # Placeholder logic
-        return "an upward trend"
-    
+        return _market_state(0, bool(funding_data))[2]
+
     def _get_competition_level(self, competitors: List[Dict[str, Any]]) -> str:
         """Determine competition level based on number of competitors."""
-        if len(competitors) > 5:
-            return "a high"
-        elif len(competitors) > 2:
-            return "a moderate"
-        else:
-            return "a low"
+        return _market_state(len(competitors), False)[1]
     
     def _get_differentiation_level(self, competitors: List[Dict[str, Any]]) -> str:
         """Determine differentiation level based on competitor features."""
         # Placeholder logic
         return "significant"
     
-    def _get_random_strength(self, domain: str, features: List[str]) -> str:
-        """Generate a random strength based on domain and features."""
-        strengths = [
-            f"Unique approach to {domain} with focus on user experience",
-            f"Innovative integration of {', '.join(features[:2]) if features else domain} technologies",
-            f"Strong potential for network effects in {domain} space"
-        ]
-        import random
-        return random.choice(strengths)
-    
-    def _get_random_weakness(self, domain: str) -> str:
-        """Generate a random weakness based on domain."""
-        weaknesses = [
-            f"Limited initial brand recognition in {domain} market",
-            f"Potential high customer acquisition costs in {domain} space",
-            f"Technical complexity of implementing all planned features"
-        ]
-        import random
-        return random.choice(weaknesses)
-    
-    def _get_random_opportunity(self, domain: str, web_results: List[Dict[str, Any]]) -> str:
-        """Generate a random opportunity based on domain and web results."""
-        opportunities = [
-            f"Growing {domain} market with increasing user adoption",
-            f"Untapped international markets for {domain} solutions",
-            f"Integration possibilities with complementary {domain} services"
-        ]
-        import random
-        return random.choice(opportunities)
-    
-    def _get_random_threat(self, domain: str, competitors: List[Dict[str, Any]]) -> str:
-        """Generate a random threat based on domain and competitors."""
-        threats = [
-            f"Rapid technological changes in {domain} landscape",
-            f"Potential for larger tech companies to enter {domain} space",
-            f"Price competition from established players"
-        ]
-        import random
-        return random.choice(threats)
-
     def _generate_financial_overview(self, finance_data: Dict[str, Any]) -> str:
         """
         Generate the financial overview section based on Yahoo Finance data.
@@ -400,7 +555,9 @@ of $X million raised across Y funding rounds in the past 24 months.
         pe_ratio = finance_data.get("pe_ratio", "N/A")
         chart_path = finance_data.get("chart_path", "")
         
-        # Format the financial overview section
+        # Format the section in one build; the optional chart reference is
+        # interpolated rather than appended onto an existing string
+        chart_md = f"\n![Price Trend]({chart_path})\n" if chart_path else ""
         financial_overview = f"""
 ## Financial Overview (Yahoo Finance)
 
@@ -411,11 +568,8 @@ of $X million raised across Y funding rounds in the past 24 months.
 | 1-Year Change | {yearly_change} |
 | P/E Ratio | {pe_ratio} |
 
-"""
-        # Add chart if available
-        if chart_path:
-            financial_overview += f"\n![Price Trend]({chart_path})\n"
-            
+{chart_md}"""
+
         return financial_overview.strip()
         
     def _generate_recent_headlines(self, news_results: List[Dict[str, Any]]) -> str:
@@ -428,16 +582,12 @@ of $X million raised across Y funding rounds in the past 24 months.
         Returns:
             Recent headlines section text
         """
-        # Format the recent headlines section
-        headlines = "## Recent Headlines (NewsAPI)\n\n"
-        
-        # Add up to 5 headlines
-        for i, article in enumerate(news_results[:5]):
-            title = article.get("title", "Untitled")
-            source = article.get("source", {}).get("name", "Unknown Source")
-            date = article.get("publishedAt", "").split("T")[0]  # Extract date part
-            url = article.get("url", "#")
-            
-            headlines += f"- [{title}]({url}) — {source} ({date})\n"
-            
-        return headlines.strip()
\ No newline at end of file
+        # Up to 5 headline rows, joined once instead of growing the
+        # section string per article
+        rows = [
+            f"- [{article.get('title', 'Untitled')}]({article.get('url', '#')}) — "
+            f"{article.get('source', {}).get('name', 'Unknown Source')} "
+            f"({article.get('publishedAt', '').split('T')[0]})"
+            for article in news_results[:5]
+        ]
+        return ("## Recent Headlines (NewsAPI)\n\n" + "\n".join(rows)).strip()
\ No newline at end of file
@@ -6,16 +6,20 @@ which transforms a startup idea into a comprehensive market intelligence report.
 """
 import os
 import argparse
+import sys
 import yaml
 import time
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from string import Template
 import json
 
 # Import core modules
 from core.input_parser import IntelligentInputParser
 from core.reasoning_loop import ReasoningLoop
 from core.synthesizer import Synthesizer
-from core.output_formatter import OutputFormatter
+from core.output_formatter import OutputFormatter, domain_slug
 
 # Import tools
 from tools.competitor_finder import CompetitorFinder
@@ -26,14 +30,35 @@ from tools.rag_query_tool import RAGQueryTool
 # Import utilities
 from utils.logger import AgentLogger
 from utils.memory import WorkingMemory
-from utils.visualization import Visualizer
 from utils.confidence_scorer import ConfidenceScorer
 
+@lru_cache(maxsize=4)
 def load_config(config_path):
-    """Load configuration from YAML file."""
+    """Load configuration from YAML file. Parsed once per path."""
     with open(config_path, 'r') as f:
         return yaml.safe_load(f)
 
+# Closing console summary, parsed into a Template once at import; each
+# run only substitutes the two varying values
+_SUMMARY_TMPL = Template(
+    "\nMarket Intelligence Report generated successfully!\n"
+    "Reports saved to: $output_dir\n"
+    "Markdown report: $report_filename.md\n"
+    "HTML report: $report_filename.html\n"
+)
+
+# Tool instances keyed by constructor args, so repeated main() calls (batch
+# mode, or main used as a library function) reuse already-loaded datasets
+_TOOL_POOL = {}
+
+def get_tool(cls, **kwargs):
+    """Return a shared tool instance for the given constructor arguments."""
+    key = (cls, tuple(sorted(kwargs.items())))
+    tool = _TOOL_POOL.get(key)
+    if tool is None:
+        tool = _TOOL_POOL[key] = cls(**kwargs)
+    return tool
+
 def main():
     """Main entry point for the Market Intelligence Research Agent."""
     # Parse command line arguments
@@ -63,8 +88,9 @@ def main():
         logger.log_error(f"Error loading configuration: {str(e)}")
         return
     
-    # Initialize working memory
-    memory = WorkingMemory()
+    # Initialize working memory, sized to the loop's step budget so the
+    # event columns never reallocate
+    memory = WorkingMemory(expected_steps=config['agent']['max_iterations'])
     parsed_input = {}
     
     # Parse input idea into structured data
@@ -91,9 +117,9 @@ def main():
         return
 
     # Initialize tools
-    competitor_finder = CompetitorFinder(dataset_path="data/indian_startup_dataset.csv")
-    funding_retriever = FundingRetriever(dataset_path="data/crunchbase_investments.csv")
-    web_search_tool = WebSearchTool(api_key=api_keys['serper']['api_key'], search_engine='serper', logger=logger)
+    competitor_finder = get_tool(CompetitorFinder, dataset_path="data/indian_startup_dataset.csv")
+    funding_retriever = get_tool(FundingRetriever, dataset_path="data/crunchbase_investments.csv")
+    web_search_tool = get_tool(WebSearchTool, api_key=api_keys['serper']['api_key'], search_engine='serper', logger=logger)
 
     # Test WebSearchTool with Serper
     logger.log_info("Testing WebSearchTool with Serper...")
@@ -101,17 +127,20 @@ def main():
     serper_results = web_search_tool.search(test_query)
     logger.log_info(f"Serper search results for '{test_query}': {serper_results}")
 
-    print(f"\nSerper search results for '{test_query}':")
+    # Assemble the whole block and emit it with one stdout write instead
+    # of one syscall per line
+    lines = [f"\nSerper search results for '{test_query}':"]
     if serper_results:
         for i, result in enumerate(serper_results):
-            print(f"  {i+1}. Title: {result.get('title')}")
-            print(f"     Link: {result.get('url')}")
-            print(f"     Snippet: {result.get('snippet')}")
+            lines.append(f"  {i+1}. Title: {result.get('title')}")
+            lines.append(f"     Link: {result.get('url')}")
+            lines.append(f"     Snippet: {result.get('snippet')}")
     else:
-        print("  No results found.")
+        lines.append("  No results found.")
+    sys.stdout.write("\n".join(lines) + "\n")
     # End of temporary test
 
-    rag_query_tool = RAGQueryTool(embeddings_dir="vector_db/embeddings_store")
+    rag_query_tool = get_tool(RAGQueryTool, embeddings_dir="vector_db/embeddings_store")
     
     # Initialize confidence scorer
     confidence_scorer = ConfidenceScorer()
@@ -135,45 +164,55 @@ def main():
     # Initialize synthesizer
     synthesizer = Synthesizer(llm_api_key=api_keys['openai']['api_key'])
     
-    # Initialize visualizer
-    visualizer = Visualizer(output_dir=args.output_dir)
-    
     # Synthesize report
     logger.log_info("Synthesizing report...")
     report_data = synthesizer.synthesize(working_memory=wm, parsed_input=parsed_input)
     logger.log_info("Report synthesis completed")
+
+    # Initialize visualizer only when there is funding data to chart;
+    # importing matplotlib costs hundreds of ms on a cold start
+    if report_data.get('funding_analysis'):
+        from utils.visualization import Visualizer
+        visualizer = Visualizer(output_dir=args.output_dir)
     
     # Format output
     output_formatter = OutputFormatter()
     
     # Generate report filename based on domain
     domain = parsed_input.get('domain', 'startup')
-    report_filename = f"{domain.lower().replace(' ', '_')}_{timestamp}_report"
+    report_filename = f"{domain_slug(domain)}_{timestamp}_report"
     
-    # Format and save report
+    # Format and save report, streaming sections straight to disk. The
+    # three files are independent, so their writes run concurrently —
+    # worthwhile when the reports directory sits on networked storage.
     logger.log_info("Formatting report...")
-    markdown_report = output_formatter.format_report(report_data, parsed_input=parsed_input, output_format='markdown')
-    html_report = output_formatter.format_report(report_data, parsed_input=parsed_input, output_format='html')
-    
-    # Save reports
-    with open(os.path.join(args.output_dir, f"{report_filename}.md"), 'w') as f:
-        f.write(markdown_report)
-    
-    with open(os.path.join(args.output_dir, f"{report_filename}.html"), 'w') as f:
-        f.write(html_report)
-    
-    # Save memory state for debugging
-    with open(os.path.join(args.output_dir, f"{report_filename}_memory.json"), 'w') as f:
-        json.dump(wm, f, indent=2)
-    
+
+    def write_markdown():
+        with open(os.path.join(args.output_dir, f"{report_filename}.md"), 'w') as f:
+            output_formatter.stream_report(report_data, f, 'markdown')
+
+    def write_html():
+        with open(os.path.join(args.output_dir, f"{report_filename}.html"), 'w') as f:
+            output_formatter.stream_report(report_data, f, 'html')
+
+    def write_memory():
+        # Memory state is saved for debugging
+        with open(os.path.join(args.output_dir, f"{report_filename}_memory.json"), 'w') as f:
+            json.dump(wm, f, indent=2)
+
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        writes = [executor.submit(task) for task in (write_markdown, write_html, write_memory)]
+        for write in writes:
+            write.result()
+
     logger.log_info(f"Reports generated successfully and saved to {args.output_dir}")
     logger.log_info(f"Markdown report: {report_filename}.md")
     logger.log_info(f"HTML report: {report_filename}.html")
     
-    print(f"\nMarket Intelligence Report generated successfully!")
-    print(f"Reports saved to: {os.path.abspath(args.output_dir)}")
-    print(f"Markdown report: {report_filename}.md")
-    print(f"HTML report: {report_filename}.html")
+    sys.stdout.write(_SUMMARY_TMPL.substitute(
+        output_dir=os.path.abspath(args.output_dir),
+        report_filename=report_filename,
+    ))
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -5,8 +5,91 @@ This tool finds competitors in a specific domain using the Indian Startup datase
 """
 import pandas as pd
 import os
+import re
+from functools import lru_cache
 from typing import List, Dict, Any, Optional
 
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+
+# Only these columns are ever read; projecting at parse time skips the
+# rest of the file and the type inference for it
+_USECOLS = ['Startup Name', 'Industry', 'Description', 'Amount', 'Year']
+_DTYPES = {
+    'Startup Name': 'string',
+    'Industry': 'string',
+    'Description': 'string',
+    'Amount': 'string',
+    'Year': 'Int32',
+}
+
+
+def _to_arrow_strings(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Back the string columns with pyarrow when it is installed.
+
+    Arrow strings live in contiguous UTF-8 buffers, so str.contains and
+    str.lower scan memory directly instead of boxed Python objects. Falls
+    back to the frame as-is when pyarrow is unavailable.
+    """
+    cols = {col: 'string[pyarrow]' for col in ('Startup Name', 'Industry', 'Description', 'Amount') if col in df.columns}
+    try:
+        return df.astype(cols)
+    except (ImportError, TypeError):
+        return df
+
+
+@lru_cache(maxsize=8)
+def _load_csv(path: str, mtime: float) -> pd.DataFrame:
+    """Parse a CSV once per (path, mtime); instances share the frame."""
+    return _to_arrow_strings(pd.read_csv(path, usecols=_USECOLS, dtype=_DTYPES))
+
+
+# Mock dataset built once at import time; every instance shares the frame
+_MOCK_DF = _to_arrow_strings(pd.DataFrame({
+    'Startup Name': [
+        'HealthTrack', 'MedConnect', 'WellnessAI', 'FemHealth', 'FitTech',
+        'FinSmart', 'PayEasy', 'InvestPro', 'BankDigital', 'MoneyWise',
+        'EduLearn', 'CourseHub', 'SchoolDigital', 'TeachTech', 'LearnAI'
+    ],
+    'Industry': [
+        'Health', 'Healthcare', 'Wellness', 'FemTech', 'Fitness',
+        'FinTech', 'Payments', 'Investments', 'Banking', 'Personal Finance',
+        'EdTech', 'Online Courses', 'School Management', 'Teaching Tools', 'AI Learning'
+    ],
+    'Description': [
+        'Health tracking app with AI features',
+        'Connecting patients with doctors',
+        'AI-powered wellness recommendations',
+        'Women\'s health tracking and community',
+        'Fitness tracking with social features',
+        'Smart financial planning tools',
+        'Easy payment solutions for businesses',
+        'Investment platform for retail investors',
+        'Digital banking solutions',
+        'Personal finance management',
+        'Online learning platform',
+        'Marketplace for online courses',
+        'Digital solutions for schools',
+        'Tools for teachers and educators',
+        'AI-powered learning assistant'
+    ],
+    'Amount': [
+        '$2.5M', '$1.8M', '$3.2M', '$4.1M', '$1.2M',
+        '$5.5M', '$2.7M', '$8.3M', '$12.5M', '$3.8M',
+        '$4.2M', '$2.9M', '$1.5M', '$3.3M', '$6.7M'
+    ],
+    'Year': [
+        2020, 2019, 2021, 2018, 2022,
+        2019, 2020, 2018, 2017, 2021,
+        2020, 2019, 2021, 2018, 2022
+    ]
+}))
+
+
 class CompetitorFinder:
     """
     Finds competitors in a specific domain using the Indian Startup dataset.
@@ -21,17 +104,32 @@ class CompetitorFinder:
         """
         self.dataset_path = dataset_path
         self.df = None
-        
+        # Boolean Industry masks memoized per domain for the session
+        self._domain_masks = {}
+        # Lowercased columns cached at load time; matching reuses them
+        # instead of re-lowering per call
+        self._industry_lower = None
+        self._description_lower = None
+
+
     def load_data(self) -> None:
         """
         Load the dataset if it exists, otherwise create a mock dataset.
         """
         if os.path.exists(self.dataset_path):
-            self.df = pd.read_csv(self.dataset_path)
+            path = os.path.abspath(self.dataset_path)
+            self.df = _load_csv(path, os.path.getmtime(path))
         else:
             # Create mock data for testing
             self.df = self._create_mock_data()
-    
+
+        self._domain_masks.clear()
+        self._industry_lower = self.df['Industry'].fillna('').str.lower()
+        self._description_lower = (
+            self.df['Description'].fillna('').str.lower()
+            if 'Description' in self.df.columns else None
+        )
+
     def find_competitors(self, domain: str, features: Optional[List[str]] = None) -> List[Dict[str, Any]]:
         """
         Find competitors in the specified domain with similar features.
@@ -46,12 +144,13 @@ class CompetitorFinder:
         if self.df is None:
             self.load_data()
         
-        # Filter by domain
-        domain_keywords = self._get_domain_keywords(domain)
-        domain_mask = self.df['Industry'].str.lower().apply(
-            lambda x: any(keyword in str(x).lower() for keyword in domain_keywords)
-        )
-        
+        # Filter by domain; the boolean mask is computed once per domain
+        # and reused across calls in the same session
+        domain_key = domain.lower()
+        domain_mask = self._domain_masks.get(domain_key)
+        if domain_mask is None:
+            domain_mask = self._domain_masks[domain_key] = self._build_domain_mask(domain_key)
+
         domain_df = self.df[domain_mask]
         
         # If no competitors found, return empty list
@@ -62,13 +161,10 @@ class CompetitorFinder:
         if features and len(features) > 0:
             # This would be more sophisticated in a real implementation
             # For now, we'll just do simple keyword matching
-            feature_keywords = [f.lower() for f in features]
-            
             # Check if any feature keywords appear in the description
-            if 'Description' in domain_df.columns:
-                feature_mask = domain_df['Description'].str.lower().apply(
-                    lambda x: any(keyword in str(x).lower() for keyword in feature_keywords)
-                )
+            if self._description_lower is not None:
+                feature_pat = "|".join(re.escape(f.lower()) for f in features)
+                feature_mask = self._description_lower[domain_mask].str.contains(feature_pat, na=False, regex=True)
                 feature_df = domain_df[feature_mask]
                 
                 # If we found matches with features, use that
@@ -90,6 +186,34 @@ class CompetitorFinder:
         
         return competitors
     
+    def _build_domain_mask(self, domain: str) -> pd.Series:
+        """
+        Build the boolean Industry mask for a domain.
+
+        Uses an Aho-Corasick automaton when the optional dependency is
+        installed — one O(length) walk per cell regardless of keyword
+        count — and a compiled regex alternation otherwise.
+
+        Args:
+            domain: Lowercased business domain
+
+        Returns:
+            Boolean Series over the Industry column
+        """
+        keywords = self._get_domain_keywords(domain)
+
+        if ahocorasick is not None:
+            automaton = ahocorasick.Automaton()
+            for keyword in keywords:
+                automaton.add_word(keyword, keyword)
+            automaton.make_automaton()
+            return self._industry_lower.map(
+                lambda s: next(automaton.iter(s), None) is not None
+            )
+
+        pattern = "|".join(re.escape(keyword) for keyword in keywords)
+        return self._industry_lower.str.contains(pattern, na=False, regex=True)
+
     def _get_domain_keywords(self, domain: str) -> List[str]:
         """
         Get keywords related to a domain for better matching.
@@ -155,48 +279,10 @@ class CompetitorFinder:
     def _create_mock_data(self) -> pd.DataFrame:
         """
         Create mock data for testing when the dataset is not available.
-        
+
         Returns:
-            DataFrame with mock data
-        """
-        data = {
-            'Startup Name': [
-                'HealthTrack', 'MedConnect', 'WellnessAI', 'FemHealth', 'FitTech',
-                'FinSmart', 'PayEasy', 'InvestPro', 'BankDigital', 'MoneyWise',
-                'EduLearn', 'CourseHub', 'SchoolDigital', 'TeachTech', 'LearnAI'
-            ],
-            'Industry': [
-                'Health', 'Healthcare', 'Wellness', 'FemTech', 'Fitness',
-                'FinTech', 'Payments', 'Investments', 'Banking', 'Personal Finance',
-                'EdTech', 'Online Courses', 'School Management', 'Teaching Tools', 'AI Learning'
-            ],
-            'Description': [
-                'Health tracking app with AI features',
-                'Connecting patients with doctors',
-                'AI-powered wellness recommendations',
-                'Women\'s health tracking and community',
-                'Fitness tracking with social features',
-                'Smart financial planning tools',
-                'Easy payment solutions for businesses',
-                'Investment platform for retail investors',
-                'Digital banking solutions',
-                'Personal finance management',
-                'Online learning platform',
-                'Marketplace for online courses',
-                'Digital solutions for schools',
-                'Tools for teachers and educators',
-                'AI-powered learning assistant'
-            ],
-            'Amount': [
-                '$2.5M', '$1.8M', '$3.2M', '$4.1M', '$1.2M',
-                '$5.5M', '$2.7M', '$8.3M', '$12.5M', '$3.8M',
-                '$4.2M', '$2.9M', '$1.5M', '$3.3M', '$6.7M'
-            ],
-            'Year': [
-                2020, 2019, 2021, 2018, 2022,
-                2019, 2020, 2018, 2017, 2021,
-                2020, 2019, 2021, 2018, 2022
-            ]
-        }
-        
-        return pd.DataFrame(data)
\ No newline at end of file
+            Shared module-level DataFrame with mock data
+        """
+        # The frame is built once at import time; callers must treat it
+        # as read-only
+        return _MOCK_DF
\ No newline at end of file
@@ -4,40 +4,361 @@ RAG Query Tool for Market Intelligence Research Agent.
 This tool performs semantic search using a vector database for retrieval-augmented generation.
 """
 import os
+import json
+import re
 import numpy as np
 from typing import List, Dict, Any, Optional
 
+# Optional GPU backend: torch is only used when installed and a CUDA device
+# is available, so the tool stays usable on CPU-only installs.
+try:
+    import torch
+    import torch.nn.functional as F
+    _TORCH_CUDA = torch.cuda.is_available()
+except ImportError:
+    torch = None
+    _TORCH_CUDA = False
+
+# Optional Numba backend: a JIT-compiled parallel kernel beats the plain
+# NumPy dot product on multi-core CPUs, while staying a pure-Python install.
+try:
+    from numba import njit, prange
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _cosine_scores_numba(q, X):
+        out = np.empty(X.shape[0], dtype=np.float32)
+        for i in prange(X.shape[0]):
+            s = 0.0
+            for j in range(X.shape[1]):
+                s += q[j] * X[i, j]
+            out[i] = s
+        return out
+except ImportError:
+    _cosine_scores_numba = None
+
+
+# One compiled alternation over the known domains; a single C-level scan
+# replaces a Python loop of per-domain substring checks on a re-lowered
+# copy of the query
+_DOMAIN_RE = re.compile(r"health|finance|education|e-commerce|social", re.IGNORECASE)
+
+
+# Mock corpus results keyed by domain, built once at import time;
+# every query slices the shared lists instead of rebuilding the dict
+_MOCK_RESULTS = {
+    "health": [
+        {
+            "content": "The health tech market is growing rapidly, with a focus on personalized medicine and AI-driven diagnostics. Key success factors include user experience, data privacy, and integration with existing healthcare systems.",
+            "source": "Healthcare Industry Report 2023",
+            "similarity": 0.92
+        },
+        {
+            "content": "Women's health startups raised over $1.3 billion in funding in 2022, with menstrual health tracking apps being a significant category. The most successful apps combine tracking with community features and personalized insights.",
+            "source": "FemTech Market Analysis",
+            "similarity": 0.88
+        },
+        {
+            "content": "Health app retention rates average 23% after 30 days, significantly lower than other app categories. Apps that incorporate social features and gamification show 45% higher retention rates.",
+            "source": "Mobile Health App Engagement Study",
+            "similarity": 0.85
+        },
+        {
+            "content": "Regulatory compliance is a major challenge for health tech startups. Successful companies allocate 15-20% of their initial budget to compliance and privacy measures.",
+            "source": "Health Tech Startup Guide",
+            "similarity": 0.82
+        }
+    ],
+    "finance": [
+        {
+            "content": "Fintech adoption rates have reached 64% globally, with highest penetration in money transfer and payments. Emerging markets show faster adoption than developed markets.",
+            "source": "Global Fintech Adoption Index",
+            "similarity": 0.91
+        },
+        {
+            "content": "Successful fintech startups focus on solving specific pain points rather than offering comprehensive solutions initially. The 'land and expand' strategy has proven most effective for market penetration.",
+            "source": "Fintech Success Patterns",
+            "similarity": 0.87
+        },
+        {
+            "content": "Regulatory technology (RegTech) is the fastest growing fintech subsector, with a CAGR of 25.5% projected through 2025.",
+            "source": "Fintech Sector Analysis",
+            "similarity": 0.84
+        }
+    ],
+    "education": [
+        {
+            "content": "EdTech funding reached $16.1 billion in 2020, with K-12 and enterprise learning solutions receiving the largest share. Successful startups demonstrate measurable learning outcomes.",
+            "source": "EdTech Investment Report",
+            "similarity": 0.93
+        },
+        {
+            "content": "Personalized learning platforms show 40% better engagement than traditional online courses. Adaptive learning algorithms and spaced repetition are key technological differentiators.",
+            "source": "Online Education Effectiveness Study",
+            "similarity": 0.89
+        },
+        {
+            "content": "The B2B education market is growing faster than B2C, with enterprise training solutions commanding higher customer lifetime values and lower acquisition costs.",
+            "source": "Education Market Trends",
+            "similarity": 0.86
+        }
+    ],
+    "e-commerce": [
+        {
+            "content": "Direct-to-consumer (DTC) brands with strong community engagement show 3x higher customer lifetime value. Social commerce integration is a key success factor.",
+            "source": "E-commerce Business Models Analysis",
+            "similarity": 0.94
+        },
+        {
+            "content": "Marketplace startups face a critical 'chicken and egg' problem. Successful platforms focus on supply-side acquisition first, ensuring quality before scaling demand.",
+            "source": "Marketplace Startup Playbook",
+            "similarity": 0.90
+        },
+        {
+            "content": "Subscription e-commerce has grown by 100% annually over the past five years. Curation and personalization are the primary drivers of customer satisfaction.",
+            "source": "Subscription Economy Report",
+            "similarity": 0.87
+        }
+    ],
+    "social": [
+        {
+            "content": "Niche social platforms show higher engagement rates than general platforms. Communities focused on specific interests have 5x the engagement and 3x the retention.",
+            "source": "Social Platform Engagement Study",
+            "similarity": 0.95
+        },
+        {
+            "content": "Content moderation costs average 20% of operating expenses for social platforms. AI-based moderation can reduce this to 8-12% while maintaining quality.",
+            "source": "Social Media Operations Analysis",
+            "similarity": 0.91
+        },
+        {
+            "content": "Social platforms with integrated creator monetization tools show 70% higher content production rates and 50% higher user retention.",
+            "source": "Creator Economy Impact Report",
+            "similarity": 0.88
+        }
+    ],
+    "technology": [
+        {
+            "content": "SaaS startups with product-led growth strategies show 2x faster revenue growth compared to sales-led companies in the early stages.",
+            "source": "SaaS Growth Strategies Report",
+            "similarity": 0.92
+        },
+        {
+            "content": "AI startups require 30% more capital to reach product-market fit compared to traditional software startups, but achieve 2.5x higher valuations at Series A.",
+            "source": "AI Startup Benchmarks",
+            "similarity": 0.89
+        },
+        {
+            "content": "Open source business models are gaining traction, with 70% of enterprise software companies now incorporating open source components in their strategy.",
+            "source": "Open Source Business Models Analysis",
+            "similarity": 0.86
+        }
+    ]
+}
+
+
 class RAGQueryTool:
     """
     Performs semantic search using a vector database for retrieval-augmented generation.
     """
-    
+
     def __init__(self, embeddings_dir: str = "../vector_db/embeddings_store"):
         """
         Initialize the RAG query tool.
-        
+
         Args:
             embeddings_dir: Directory containing vector embeddings
         """
         self.embeddings_dir = embeddings_dir
-        
+        self.embeddings = None
+        self.documents = None
+        self.encoder = None
+        self._embeddings_gpu = None
+        self._embeddings_f32 = None
+        self._load_embeddings_store()
+
+    def _load_embeddings_store(self) -> None:
+        """
+        Load the embeddings store from disk if one exists.
+
+        Prefers `embeddings.f16` (a raw float16 binary of pre-normalized
+        vectors) described by `embeddings_meta.json` with keys "N" and "d";
+        this is memory-mapped so startup is instant and the OS page cache
+        handles residency. Falls back to loading `embeddings.npy` eagerly,
+        and to mock results when neither exists alongside `documents.json`.
+        """
+        raw_path = os.path.join(self.embeddings_dir, "embeddings.f16")
+        meta_path = os.path.join(self.embeddings_dir, "embeddings_meta.json")
+        emb_path = os.path.join(self.embeddings_dir, "embeddings.npy")
+        docs_path = os.path.join(self.embeddings_dir, "documents.json")
+
+        if not os.path.exists(docs_path):
+            return
+
+        if os.path.exists(raw_path) and os.path.exists(meta_path):
+            with open(meta_path, "r") as f:
+                meta = json.load(f)
+            # Vectors are normalized at build time, so the memory-mapped
+            # array can stay read-only and shared between worker processes
+            self.embeddings = np.memmap(
+                raw_path, dtype=np.float16, mode="r", shape=(meta["N"], meta["d"])
+            )
+        elif os.path.exists(emb_path):
+            embeddings = np.load(emb_path)
+            # Normalize once so scoring reduces to a dot product
+            norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+            norms[norms == 0] = 1.0
+            # Store as float16: cosine scoring is memory-bound, so halving
+            # the bytes moved per vector roughly doubles throughput
+            self.embeddings = (embeddings / norms).astype(np.float16)
+        else:
+            return
+
+        with open(docs_path, "r") as f:
+            self.documents = json.load(f)
+
+        # Keep a GPU copy when CUDA is available; bulk cosine scoring on the
+        # GPU is one kernel launch instead of a CPU brute-force pass.
+        # bfloat16 halves device memory and bandwidth versus float32.
+        if _TORCH_CUDA:
+            self._embeddings_gpu = torch.from_numpy(
+                np.ascontiguousarray(self.embeddings, dtype=np.float32)
+            ).to(torch.bfloat16).cuda()
+
+    def _encode_query(self, query: str) -> Optional[np.ndarray]:
+        """
+        Encode a query string into a normalized embedding vector.
+
+        Args:
+            query: Query string
+
+        Returns:
+            Normalized embedding vector, or None if no encoder is available
+        """
+        if self.encoder is None:
+            try:
+                from sentence_transformers import SentenceTransformer
+            except ImportError:
+                return None
+            self.encoder = SentenceTransformer("all-MiniLM-L6-v2")
+
+        vector = self.encoder.encode(query, convert_to_numpy=True)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def _score_embeddings(self, query_vector: np.ndarray) -> np.ndarray:
+        """
+        Score the query vector against all stored embeddings.
+
+        Args:
+            query_vector: Normalized query embedding
+
+        Returns:
+            Array of cosine similarity scores, one per stored document
+        """
+        if self._embeddings_gpu is not None:
+            q = torch.from_numpy(query_vector).to(self._embeddings_gpu.dtype).cuda()
+            scores = F.cosine_similarity(q.unsqueeze(0), self._embeddings_gpu)
+            return scores.float().cpu().numpy()
+
+        # Numba kernel needs float32; keep a lazily-built contiguous copy
+        if _cosine_scores_numba is not None:
+            if self._embeddings_f32 is None:
+                self._embeddings_f32 = np.ascontiguousarray(
+                    self.embeddings, dtype=np.float32
+                )
+            return _cosine_scores_numba(
+                query_vector.astype(np.float32), self._embeddings_f32
+            )
+
+        # Embeddings are pre-normalized, so cosine similarity is a dot
+        # product; match the half-precision store dtype and widen the result
+        q = query_vector.astype(self.embeddings.dtype, copy=False)
+        return (self.embeddings @ q).astype(np.float32)
+
+    @staticmethod
+    def _top_k_indices(scores: np.ndarray, top_k: int) -> np.ndarray:
+        """
+        Return the indices of the top_k highest scores, best first.
+
+        Uses np.argpartition for an O(N) partial selection instead of a full
+        O(N log N) sort; only the selected top_k entries are then ordered.
+
+        Args:
+            scores: Array of similarity scores
+            top_k: Number of indices to return
+
+        Returns:
+            Array of at most top_k indices, sorted by descending score
+        """
+        if top_k >= scores.shape[0]:
+            return np.argsort(-scores)
+        idx = np.argpartition(-scores, top_k)[:top_k]
+        return idx[np.argsort(-scores[idx])]
+
     def query(self, query: str, top_k: int = 3) -> List[Dict[str, Any]]:
         """
         Query the vector database for relevant information.
-        
+
         Args:
             query: Query string
             top_k: Number of top results to return
-            
+
         Returns:
             List of relevant documents with similarity scores
         """
-        # In a production system, this would use a real vector database
-        # For now, we'll return mock results
-        
+        # Use the real embeddings store when available
+        if self.embeddings is not None:
+            query_vector = self._encode_query(query)
+            if query_vector is not None:
+                scores = self._score_embeddings(query_vector)
+                top_indices = self._top_k_indices(scores, top_k)
+                return [
+                    dict(self.documents[i], similarity=float(scores[i]))
+                    for i in top_indices
+                ]
+
+        # Otherwise fall back to mock results
         domain = self._extract_domain(query)
-        
+
         return self._get_mock_results(domain, top_k)
+
+    def query_batch(self, queries: List[str], top_k: int = 3) -> List[List[Dict[str, Any]]]:
+        """
+        Query the vector database for several queries at once.
+
+        Batching encodes all queries in one model call and scores them with a
+        single (B, d) x (d, N) matrix multiply, which is far cheaper than B
+        separate matrix-vector products.
+
+        Args:
+            queries: List of query strings
+            top_k: Number of top results to return per query
+
+        Returns:
+            List of result lists, one per query, in input order
+        """
+        if self.embeddings is not None and queries:
+            if self.encoder is None:
+                # Trigger lazy encoder load (and detect availability)
+                self._encode_query(queries[0])
+            if self.encoder is not None:
+                query_matrix = self.encoder.encode(queries, convert_to_numpy=True)
+                norms = np.linalg.norm(query_matrix, axis=1, keepdims=True)
+                norms[norms == 0] = 1.0
+                query_matrix = query_matrix / norms
+
+                scores = query_matrix @ self.embeddings.T  # (B, N)
+                results = []
+                for row in scores:
+                    top_indices = self._top_k_indices(row, top_k)
+                    results.append([
+                        dict(self.documents[i], similarity=float(row[i]))
+                        for i in top_indices
+                    ])
+                return results
+
+        # Mock fallback: no BLAS to amortize, query one at a time
+        return [self.query(q, top_k) for q in queries]
     
     def _extract_domain(self, query: str) -> str:
         """
@@ -49,12 +370,10 @@ class RAGQueryTool:
         Returns:
             Domain extracted from query
         """
-        domains = ["health", "finance", "education", "e-commerce", "social"]
-        
-        for domain in domains:
-            if domain.lower() in query.lower():
-                return domain
-        
+        match = _DOMAIN_RE.search(query)
+        if match:
+            return match.group(0).lower()
+
         # Default domain if none found
         return "technology"
     
@@ -69,115 +388,7 @@ class RAGQueryTool:
         Returns:
             List of mock results
         """
-        mock_data = {
-            "health": [
-                {
-                    "content": "The health tech market is growing rapidly, with a focus on personalized medicine and AI-driven diagnostics. Key success factors include user experience, data privacy, and integration with existing healthcare systems.",
-                    "source": "Healthcare Industry Report 2023",
-                    "similarity": 0.92
-                },
-                {
-                    "content": "Women's health startups raised over $1.3 billion in funding in 2022, with menstrual health tracking apps being a significant category. The most successful apps combine tracking with community features and personalized insights.",
-                    "source": "FemTech Market Analysis",
-                    "similarity": 0.88
-                },
-                {
-                    "content": "Health app retention rates average 23% after 30 days, significantly lower than other app categories. Apps that incorporate social features and gamification show 45% higher retention rates.",
-                    "source": "Mobile Health App Engagement Study",
-                    "similarity": 0.85
-                },
-                {
-                    "content": "Regulatory compliance is a major challenge for health tech startups. Successful companies allocate 15-20% of their initial budget to compliance and privacy measures.",
-                    "source": "Health Tech Startup Guide",
-                    "similarity": 0.82
-                }
-            ],
-            "finance": [
-                {
-                    "content": "Fintech adoption rates have reached 64% globally, with highest penetration in money transfer and payments. Emerging markets show faster adoption than developed markets.",
-                    "source": "Global Fintech Adoption Index",
-                    "similarity": 0.91
-                },
-                {
-                    "content": "Successful fintech startups focus on solving specific pain points rather than offering comprehensive solutions initially. The 'land and expand' strategy has proven most effective for market penetration.",
-                    "source": "Fintech Success Patterns",
-                    "similarity": 0.87
-                },
-                {
-                    "content": "Regulatory technology (RegTech) is the fastest growing fintech subsector, with a CAGR of 25.5% projected through 2025.",
-                    "source": "Fintech Sector Analysis",
-                    "similarity": 0.84
-                }
-            ],
-            "education": [
-                {
-                    "content": "EdTech funding reached $16.1 billion in 2020, with K-12 and enterprise learning solutions receiving the largest share. Successful startups demonstrate measurable learning outcomes.",
-                    "source": "EdTech Investment Report",
-                    "similarity": 0.93
-                },
-                {
-                    "content": "Personalized learning platforms show 40% better engagement than traditional online courses. Adaptive learning algorithms and spaced repetition are key technological differentiators.",
-                    "source": "Online Education Effectiveness Study",
-                    "similarity": 0.89
-                },
-                {
-                    "content": "The B2B education market is growing faster than B2C, with enterprise training solutions commanding higher customer lifetime values and lower acquisition costs.",
-                    "source": "Education Market Trends",
-                    "similarity": 0.86
-                }
-            ],
-            "e-commerce": [
-                {
-                    "content": "Direct-to-consumer (DTC) brands with strong community engagement show 3x higher customer lifetime value. Social commerce integration is a key success factor.",
-                    "source": "E-commerce Business Models Analysis",
-                    "similarity": 0.94
-                },
-                {
-                    "content": "Marketplace startups face a critical 'chicken and egg' problem. Successful platforms focus on supply-side acquisition first, ensuring quality before scaling demand.",
-                    "source": "Marketplace Startup Playbook",
-                    "similarity": 0.90
-                },
-                {
-                    "content": "Subscription e-commerce has grown by 100% annually over the past five years. Curation and personalization are the primary drivers of customer satisfaction.",
-                    "source": "Subscription Economy Report",
-                    "similarity": 0.87
-                }
-            ],
-            "social": [
-                {
-                    "content": "Niche social platforms show higher engagement rates than general platforms. Communities focused on specific interests have 5x the engagement and 3x the retention.",
-                    "source": "Social Platform Engagement Study",
-                    "similarity": 0.95
-                },
-                {
-                    "content": "Content moderation costs average 20% of operating expenses for social platforms. AI-based moderation can reduce this to 8-12% while maintaining quality.",
-                    "source": "Social Media Operations Analysis",
-                    "similarity": 0.91
-                },
-                {
-                    "content": "Social platforms with integrated creator monetization tools show 70% higher content production rates and 50% higher user retention.",
-                    "source": "Creator Economy Impact Report",
-                    "similarity": 0.88
-                }
-            ],
-            "technology": [
-                {
-                    "content": "SaaS startups with product-led growth strategies show 2x faster revenue growth compared to sales-led companies in the early stages.",
-                    "source": "SaaS Growth Strategies Report",
-                    "similarity": 0.92
-                },
-                {
-                    "content": "AI startups require 30% more capital to reach product-market fit compared to traditional software startups, but achieve 2.5x higher valuations at Series A.",
-                    "source": "AI Startup Benchmarks",
-                    "similarity": 0.89
-                },
-                {
-                    "content": "Open source business models are gaining traction, with 70% of enterprise software companies now incorporating open source components in their strategy.",
-                    "source": "Open Source Business Models Analysis",
-                    "similarity": 0.86
-                }
-            ]
-        }
-        
-        # Return results for the specified domain
-        return mock_data.get(domain.lower(), mock_data["technology"])[:top_k]
\ No newline at end of file
+        # Return per-call copies of the shared corpus rows; callers such
+        # as the reasoning loop's embedder annotate result dicts in place,
+        # which must not pollute the module-level mock data
+        return [dict(result) for result in _MOCK_RESULTS.get(domain.lower(), _MOCK_RESULTS["technology"])[:top_k]]
\ No newline at end of file
@@ -5,10 +5,23 @@ This tool performs web searches using the Serper API.
 """
 import os
 import json
+import re
 import requests
 from typing import List, Dict, Any, Optional
 from utils.logger import AgentLogger
 
+
+# One compiled scan over the query replaces a Python loop of lowered
+# substring checks; the match maps back to its display-cased label
+_DOMAIN_RE = re.compile(r'(health|finance|education|e-commerce|social)', re.IGNORECASE)
+_DOMAIN_TITLES = {
+    "health": "Health",
+    "finance": "Finance",
+    "education": "Education",
+    "e-commerce": "E-commerce",
+    "social": "Social",
+}
+
 class WebSearchTool:
     """
     Performs web searches using the Serper API.
@@ -17,7 +30,7 @@ class WebSearchTool:
     def __init__(self, api_key: Optional[str] = None, search_engine: str = "serper", logger: AgentLogger = None):
         """
         Initialize the web search tool.
-        
+
         Args:
             api_key: API key for Serper
             search_engine: Should be "serper" (kept for backward compatibility)
@@ -25,22 +38,33 @@ class WebSearchTool:
         """
         self.api_key = api_key or os.environ.get("SERPER_API_KEY")
         self.logger = logger if logger else AgentLogger()
-        
+        self.search_engine = search_engine
+
+        # Resolve the engine name to its implementation once here, so
+        # search dispatches through the bound method with no per-call
+        # lookup and unsupported engines fail at construction
+        implementations = {
+            "serper": self._serper_search,
+        }
+        try:
+            self._impl = implementations[search_engine]
+        except KeyError:
+            raise ValueError(f"Unsupported search engine: {search_engine}")
+
     def search(self, query: str, num_results: int = 5) -> List[Dict[str, str]]:
         """
         Perform a web search with the given query using Serper API.
-        
+
         Args:
             query: Search query
             num_results: Number of results to return
-            
+
         Returns:
             List of search result dictionaries
         """
-        return self._serper_search(query, num_results)
-    
+        return self._impl(query, num_results)
+
 
-    
     def _serper_search(self, query: str, num_results: int) -> List[Dict[str, str]]:
         """
         Perform a real Serper search.
@@ -106,11 +130,9 @@ class WebSearchTool:
         Returns:
             Domain extracted from query
         """
-        domains = ["Health", "Finance", "Education", "E-commerce", "Social"]
-        
-        for domain in domains:
-            if domain.lower() in query.lower():
-                return domain
-        
+        match = _DOMAIN_RE.search(query)
+        if match:
+            return _DOMAIN_TITLES[match.group(1).lower()]
+
         # Default domain if none found
         return "Technology"
\ No newline at end of file
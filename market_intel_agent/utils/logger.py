@@ -3,10 +3,18 @@ Logger utility for Market Intelligence Research Agent.
 
 This module provides logging functionality for tracking agent actions, thoughts, and observations.
 """
+import atexit
 import logging
+import logging.handlers
 import os
 from datetime import datetime
 
+
+# One formatter shared by every handler; rebuilding it per AgentLogger
+# construction buys nothing
+_FORMATTER = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+
+
 class AgentLogger:
     """
     Logger for tracking agent actions, thoughts, and observations.
@@ -32,24 +40,49 @@ class AgentLogger:
         # Configure logger
         self.logger = logging.getLogger("market_intel_agent")
         self.logger.setLevel(log_level)
-        
-        # Create file handler
-        file_handler = logging.FileHandler(log_file)
+        # Don't double-log through the root logger
+        self.logger.propagate = False
+
+        # The named logger is a process-wide singleton; attaching fresh
+        # handlers on every AgentLogger construction would multiply each
+        # record by the number of instantiations
+        if self.logger.handlers:
+            return
+
+        # Create file handler; delay=True defers opening the file until
+        # the first record actually reaches it
+        file_handler = logging.FileHandler(log_file, delay=True)
         file_handler.setLevel(log_level)
-        
+
         # Create console handler
         console_handler = logging.StreamHandler()
         console_handler.setLevel(log_level)
-        
-        # Create formatter
-        formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-        file_handler.setFormatter(formatter)
-        console_handler.setFormatter(formatter)
-        
+
+        # Attach the shared formatter
+        file_handler.setFormatter(_FORMATTER)
+        console_handler.setFormatter(_FORMATTER)
+
+        # Batch file writes through a memory buffer: records accumulate
+        # and hit disk in blocks of up to 1024 instead of one syscall per
+        # log call. Errors flush immediately, and the atexit hook drains
+        # whatever remains when the process exits. The console handler
+        # stays unbuffered for interactive feedback.
+        self._memory_handler = logging.handlers.MemoryHandler(
+            capacity=1024, flushLevel=logging.ERROR, target=file_handler
+        )
+        atexit.register(self._memory_handler.flush)
+
         # Add handlers to logger
-        self.logger.addHandler(file_handler)
+        self.logger.addHandler(self._memory_handler)
         self.logger.addHandler(console_handler)
-        
+
+    def close(self):
+        """Flush buffered records and close the logger's handlers."""
+        for handler in list(self.logger.handlers):
+            handler.flush()
+            handler.close()
+            self.logger.removeHandler(handler)
+
     def log_thought(self, thought: str):
         """
         Log an agent thought.
@@ -57,7 +90,8 @@ class AgentLogger:
         Args:
             thought: The thought to log
         """
-        self.logger.info(f"THOUGHT: {thought}")
+        # %-style args defer formatting until a handler accepts the record
+        self.logger.info("THOUGHT: %s", thought)
         
     def log_action(self, action: str, params: dict = None):
         """
@@ -67,10 +101,12 @@ class AgentLogger:
             action: The action name
             params: Action parameters
         """
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
         if params:
-            self.logger.info(f"ACTION: {action} - PARAMS: {params}")
+            self.logger.info("ACTION: %s - PARAMS: %s", action, params)
         else:
-            self.logger.info(f"ACTION: {action}")
+            self.logger.info("ACTION: %s", action)
         
     def log_observation(self, observation: str):
         """
@@ -79,7 +115,7 @@ class AgentLogger:
         Args:
             observation: The observation to log
         """
-        self.logger.info(f"OBSERVATION: {observation}")
+        self.logger.info("OBSERVATION: %s", observation)
         
     def log_error(self, error: str):
         """
@@ -88,7 +124,7 @@ class AgentLogger:
         Args:
             error: The error message
         """
-        self.logger.error(f"ERROR: {error}")
+        self.logger.error("ERROR: %s", error)
         
     def log_info(self, message: str):
         """
@@ -6,24 +6,86 @@ This module provides working memory functionality for storing agent state.
 from typing import Dict, List, Any, Optional
 import json
 import os
-from datetime import datetime
+import sys
+import time
+from datetime import datetime, timezone
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _iso(timestamp: Any) -> Any:
+    """Render an integer nanosecond timestamp as an ISO string.
+
+    Timestamps loaded from older files are already strings and pass
+    through unchanged.
+    """
+    if isinstance(timestamp, int):
+        return datetime.fromtimestamp(timestamp / 1e9, tz=timezone.utc).isoformat()
+    return timestamp
+
+
+# Fields backed by accumulating lists; anything else is stored as-is
+_LIST_FIELDS = frozenset({"competitors", "funding_data", "web_search_results", "rag_results"})
+
 
 class WorkingMemory:
     """
     Working memory for storing agent state during reasoning loop.
     """
-    
-    def __init__(self):
-        """Initialize working memory with empty collections."""
-        self.thoughts = []
-        self.actions = []
-        self.observations = []
-        self.collected_data = {
-            "competitors": [],
-            "funding_data": [],
-            "web_search_results": [],
-            "rag_results": []
-        }
+
+    # Slots shave the per-instance dict and make every attribute access
+    # an index into a fixed table
+    __slots__ = (
+        "thought_contents", "thought_ts",
+        "action_types", "action_params", "action_ts",
+        "observation_types", "observation_results", "observation_ts",
+        "competitors", "funding_data", "web_search_results", "rag_results",
+        "parsed_input", "_extra_data",
+        "_thought_idx", "_action_idx", "_observation_idx",
+        "_dirty", "_cached_bytes",
+    )
+
+
+    def __init__(self, expected_steps: int = 0):
+        """
+        Initialize working memory with empty collections.
+
+        Args:
+            expected_steps: Expected number of events per column; when
+                positive, the columns are preallocated to this size so
+                appends skip list growth reallocations
+        """
+        # Events are stored column-wise: one flat list per field instead
+        # of one dict per event, which cuts per-event allocations to the
+        # appended values themselves. get_all_data zips the columns back
+        # into dicts at export time.
+        n = max(0, expected_steps)
+        self.thought_contents = [None] * n
+        self.thought_ts = [None] * n
+        self.action_types = [None] * n
+        self.action_params = [None] * n
+        self.action_ts = [None] * n
+        self.observation_types = [None] * n
+        self.observation_results = [None] * n
+        self.observation_ts = [None] * n
+        # Write cursors; events past the preallocated cap fall back to
+        # plain appends
+        self._thought_idx = 0
+        self._action_idx = 0
+        self._observation_idx = 0
+        # Serialized snapshot reused until the memory mutates again
+        self._dirty = True
+        self._cached_bytes = None
+        # Collected-data buckets as direct attributes; one slot access
+        # instead of two hash lookups on the hot write path
+        self.competitors = []
+        self.funding_data = []
+        self.web_search_results = []
+        self.rag_results = []
+        self._extra_data = {}
         self.parsed_input = {}
         
     def add_thought(self, thought: str):
@@ -33,10 +95,17 @@ class WorkingMemory:
         Args:
             thought: The thought to add
         """
-        self.thoughts.append({
-            "content": thought,
-            "timestamp": datetime.now().isoformat()
-        })
+        # A bare integer timestamp is one allocation; ISO rendering is
+        # deferred to export
+        i = self._thought_idx
+        if i < len(self.thought_contents):
+            self.thought_contents[i] = thought
+            self.thought_ts[i] = time.time_ns()
+        else:
+            self.thought_contents.append(thought)
+            self.thought_ts.append(time.time_ns())
+        self._thought_idx = i + 1
+        self._dirty = True
         
     def add_action(self, action_type: str, params: Dict[str, Any]):
         """
@@ -46,11 +115,21 @@ class WorkingMemory:
             action_type: Type of action (e.g., "competitor_search")
             params: Action parameters
         """
-        self.actions.append({
-            "type": action_type,
-            "params": params,
-            "timestamp": datetime.now().isoformat()
-        })
+        # Action types come from a small fixed vocabulary; interning
+        # shares one string object across events and makes comparisons
+        # pointer equality
+        action_type = sys.intern(action_type)
+        i = self._action_idx
+        if i < len(self.action_types):
+            self.action_types[i] = action_type
+            self.action_params[i] = params
+            self.action_ts[i] = time.time_ns()
+        else:
+            self.action_types.append(action_type)
+            self.action_params.append(params)
+            self.action_ts.append(time.time_ns())
+        self._action_idx = i + 1
+        self._dirty = True
         
     def add_observation(self, action_type: str, result: Any):
         """
@@ -60,11 +139,18 @@ class WorkingMemory:
             action_type: Type of action that produced the observation
             result: Result of the action
         """
-        self.observations.append({
-            "action_type": action_type,
-            "result": result,
-            "timestamp": datetime.now().isoformat()
-        })
+        action_type = sys.intern(action_type)
+        i = self._observation_idx
+        if i < len(self.observation_types):
+            self.observation_types[i] = action_type
+            self.observation_results[i] = result
+            self.observation_ts[i] = time.time_ns()
+        else:
+            self.observation_types.append(action_type)
+            self.observation_results.append(result)
+            self.observation_ts.append(time.time_ns())
+        self._observation_idx = i + 1
+        self._dirty = True
         
     def update_collected_data(self, data_type: str, data: Any):
         """
@@ -74,25 +160,37 @@ class WorkingMemory:
             data_type: Type of data (e.g., "competitors")
             data: The data to add
         """
-        if data_type in self.collected_data:
-            if isinstance(self.collected_data[data_type], list):
-                if isinstance(data, list):
-                    self.collected_data[data_type].extend(data)
-                else:
-                    self.collected_data[data_type].append(data)
-            else:
-                self.collected_data[data_type] = data
+        # One frozenset membership test picks the strategy; the exact
+        # type check is a C-level pointer comparison
+        if data_type in _LIST_FIELDS:
+            bucket = getattr(self, data_type)
+            bucket.extend(data if type(data) is list else (data,))
         else:
-            self.collected_data[data_type] = data
-            
+            self._extra_data[data_type] = data
+        self._dirty = True
+
     def set_parsed_input(self, parsed_input: Dict[str, Any]):
         """
         Set parsed input data.
-        
+
         Args:
             parsed_input: Parsed input data
         """
         self.parsed_input = parsed_input
+        self._dirty = True
+
+    @property
+    def collected_data(self) -> Dict[str, Any]:
+        """Assemble the bucket attributes into the classic dict shape."""
+        data = {
+            "competitors": self.competitors,
+            "funding_data": self.funding_data,
+            "web_search_results": self.web_search_results,
+            "rag_results": self.rag_results,
+        }
+        if self._extra_data:
+            data.update(self._extra_data)
+        return data
         
     def get_all_data(self) -> Dict[str, Any]:
         """
@@ -103,21 +201,76 @@ class WorkingMemory:
         """
         return {
             "parsed_input": self.parsed_input,
-            "thoughts": self.thoughts,
-            "actions": self.actions,
-            "observations": self.observations,
+            "thoughts": [
+                {"content": content, "timestamp": _iso(ts)}
+                for content, ts in zip(self.thought_contents[:self._thought_idx], self.thought_ts)
+            ],
+            "actions": [
+                {"type": action_type, "params": params, "timestamp": _iso(ts)}
+                for action_type, params, ts in zip(self.action_types[:self._action_idx], self.action_params, self.action_ts)
+            ],
+            "observations": [
+                {"action_type": action_type, "result": result, "timestamp": _iso(ts)}
+                for action_type, result, ts in zip(self.observation_types[:self._observation_idx], self.observation_results, self.observation_ts)
+            ],
             "collected_data": self.collected_data
         }
         
+    def _serialize(self) -> bytes:
+        """
+        Encode the memory as JSON bytes through precomputed key prefixes.
+
+        The output shape is fixed, so the encoder stitches constant byte
+        prefixes to the encoded values column by column instead of
+        assembling the get_all_data dict and walking it with a generic
+        encoder.
+
+        Returns:
+            Compact JSON document as bytes
+        """
+        if orjson is not None:
+            dumps = orjson.dumps
+        else:
+            def dumps(obj):
+                return json.dumps(obj).encode('utf-8')
+
+        parts = [b'{"parsed_input":', dumps(self.parsed_input), b',"thoughts":[']
+        parts.append(b",".join(
+            b'{"content":' + dumps(content) + b',"timestamp":' + dumps(_iso(ts)) + b'}'
+            for content, ts in zip(self.thought_contents[:self._thought_idx], self.thought_ts)
+        ))
+        parts.append(b'],"actions":[')
+        parts.append(b",".join(
+            b'{"type":' + dumps(action_type) + b',"params":' + dumps(params)
+            + b',"timestamp":' + dumps(_iso(ts)) + b'}'
+            for action_type, params, ts in zip(self.action_types[:self._action_idx], self.action_params, self.action_ts)
+        ))
+        parts.append(b'],"observations":[')
+        parts.append(b",".join(
+            b'{"action_type":' + dumps(action_type) + b',"result":' + dumps(result)
+            + b',"timestamp":' + dumps(_iso(ts)) + b'}'
+            for action_type, result, ts in zip(self.observation_types[:self._observation_idx], self.observation_results, self.observation_ts)
+        ))
+        parts.append(b'],"collected_data":')
+        parts.append(dumps(self.collected_data))
+        parts.append(b'}')
+        return b"".join(parts)
+
     def save_to_file(self, file_path: str):
         """
         Save memory to a JSON file.
-        
+
         Args:
             file_path: Path to save the file
         """
-        with open(file_path, 'w') as f:
-            json.dump(self.get_all_data(), f, indent=2)
+        # The specialized encoder skips the intermediate dict build; its
+        # bytes are cached and reused for repeated saves of unchanged
+        # memory
+        if self._dirty or self._cached_bytes is None:
+            self._cached_bytes = self._serialize()
+            self._dirty = False
+        with open(file_path, 'wb') as f:
+            f.write(self._cached_bytes)
             
     def load_from_file(self, file_path: str):
         """
@@ -126,16 +279,39 @@ class WorkingMemory:
         Args:
             file_path: Path to load the file from
         """
-        with open(file_path, 'r') as f:
-            data = json.load(f)
+        # One binary read plus a C-level parse when orjson is available
+        if orjson is not None:
+            with open(file_path, 'rb') as f:
+                data = orjson.loads(f.read())
+        else:
+            with open(file_path, 'r') as f:
+                data = json.load(f)
             
         self.parsed_input = data.get("parsed_input", {})
-        self.thoughts = data.get("thoughts", [])
-        self.actions = data.get("actions", [])
-        self.observations = data.get("observations", [])
-        self.collected_data = data.get("collected_data", {
-            "competitors": [],
-            "funding_data": [],
-            "web_search_results": [],
-            "rag_results": []
-        })
\ No newline at end of file
+
+        # Files store row-oriented event dicts; unzip them back into the
+        # column layout
+        thoughts = data.get("thoughts", [])
+        self.thought_contents = [t.get("content") for t in thoughts]
+        self.thought_ts = [t.get("timestamp") for t in thoughts]
+        actions = data.get("actions", [])
+        self.action_types = [a.get("type") for a in actions]
+        self.action_params = [a.get("params") for a in actions]
+        self.action_ts = [a.get("timestamp") for a in actions]
+        observations = data.get("observations", [])
+        self.observation_types = [o.get("action_type") for o in observations]
+        self.observation_results = [o.get("result") for o in observations]
+        self.observation_ts = [o.get("timestamp") for o in observations]
+        self._thought_idx = len(thoughts)
+        self._action_idx = len(actions)
+        self._observation_idx = len(observations)
+        self._dirty = True
+
+        collected = data.get("collected_data", {})
+        self.competitors = collected.get("competitors", [])
+        self.funding_data = collected.get("funding_data", [])
+        self.web_search_results = collected.get("web_search_results", [])
+        self.rag_results = collected.get("rag_results", [])
+        self._extra_data = {
+            key: value for key, value in collected.items() if key not in _LIST_FIELDS
+        }
\ No newline at end of file
@@ -3,10 +3,31 @@ Visualization utility for Market Intelligence Research Agent.
 
 This module provides visualization functionality for generating charts and graphs.
 """
-import matplotlib.pyplot as plt
 import os
+from functools import lru_cache
+
+import numpy as np
 from typing import List, Dict, Any, Optional
 
+
+@lru_cache(maxsize=1)
+def _plt():
+    """
+    Import matplotlib on first use and return the pyplot module.
+
+    The import costs hundreds of ms and tens of MB, and many runs never
+    render a chart, so it is deferred until one is actually requested.
+    The non-interactive Agg backend is forced to skip GUI probing.
+    """
+    import matplotlib
+    matplotlib.use("Agg", force=True)
+    import matplotlib.pyplot as plt
+    plt.ioff()
+    # Chunk long paths so Agg rasterizes them in bounded passes
+    plt.rcParams["agg.path.chunksize"] = 10000
+    return plt
+
+
 class Visualizer:
     """
     Visualizer for generating charts and graphs for market intelligence reports.
@@ -21,7 +42,36 @@ class Visualizer:
         """
         self.output_dir = output_dir
         os.makedirs(output_dir, exist_ok=True)
-        
+        # One Figure/Axes pair reused across charts; each call clears it
+        # instead of allocating fresh canvas and renderer objects
+        self._fig = None
+        self._ax = None
+
+    def _get_ax(self, figsize):
+        """
+        Return the shared Axes, cleared and resized for the next chart.
+
+        Args:
+            figsize: (width, height) of the chart in inches
+
+        Returns:
+            The shared matplotlib Axes
+        """
+        if self._fig is None:
+            self._fig, self._ax = _plt().subplots(figsize=figsize)
+        else:
+            self._ax.clear()
+            self._fig.set_size_inches(*figsize)
+        return self._ax
+
+    def close(self):
+        """Release the shared figure and its rendering resources."""
+        if self._fig is not None:
+            _plt().close(self._fig)
+            self._fig = None
+            self._ax = None
+
+
     def create_funding_bar_chart(self, companies: List[str], funding_amounts: List[float], 
                                  title: str = "Funding Comparison", 
                                  filename: str = "funding_chart.png") -> str:
@@ -37,19 +87,25 @@ class Visualizer:
         Returns:
             Path to the saved chart
         """
-        plt.figure(figsize=(10, 6))
-        plt.bar(companies, funding_amounts)
-        plt.title(title)
-        plt.xlabel("Companies")
-        plt.ylabel("Funding Amount (USD)")
-        plt.xticks(rotation=45, ha="right")
-        plt.tight_layout()
-        
+        # Convert once with an explicit dtype so matplotlib skips its
+        # per-element type inspection
+        funding_amounts = np.asarray(funding_amounts, dtype=np.float64)
+        plt = _plt()
+        ax = self._get_ax((10, 6))
+        bars = ax.bar(companies, funding_amounts)
+        # Rasterized patches skip the anti-aliased vector fill path
+        for bar in bars:
+            bar.set_rasterized(True)
+        ax.set_title(title)
+        ax.set_xlabel("Companies")
+        ax.set_ylabel("Funding Amount (USD)")
+        plt.setp(ax.get_xticklabels(), rotation=45, ha="right")
+        self._fig.tight_layout()
+
         # Save the chart
         output_path = os.path.join(self.output_dir, filename)
-        plt.savefig(output_path)
-        plt.close()
-        
+        self._fig.savefig(output_path, dpi=72, bbox_inches="tight")
+
         return output_path
     
     def create_market_share_pie_chart(self, companies: List[str], market_shares: List[float],
@@ -67,16 +123,16 @@ class Visualizer:
         Returns:
             Path to the saved chart
         """
-        plt.figure(figsize=(10, 8))
-        plt.pie(market_shares, labels=companies, autopct='%1.1f%%', startangle=90)
-        plt.title(title)
-        plt.axis('equal')  # Equal aspect ratio ensures that pie is drawn as a circle
-        
+        market_shares = np.asarray(market_shares, dtype=np.float64)
+        ax = self._get_ax((10, 8))
+        ax.pie(market_shares, labels=companies, autopct='%1.1f%%', startangle=90)
+        ax.set_title(title)
+        ax.axis('equal')  # Equal aspect ratio ensures that pie is drawn as a circle
+
         # Save the chart
         output_path = os.path.join(self.output_dir, filename)
-        plt.savefig(output_path)
-        plt.close()
-        
+        self._fig.savefig(output_path, dpi=72, bbox_inches="tight")
+
         return output_path
     
     def create_trend_line_chart(self, x_values: List, y_values: List, 
@@ -98,17 +154,18 @@ class Visualizer:
         Returns:
             Path to the saved chart
         """
-        plt.figure(figsize=(10, 6))
-        plt.plot(x_values, y_values, marker='o')
-        plt.title(title)
-        plt.xlabel(x_label)
-        plt.ylabel(y_label)
-        plt.grid(True, linestyle='--', alpha=0.7)
-        plt.tight_layout()
-        
+        x_values = np.asarray(x_values)
+        y_values = np.asarray(y_values, dtype=np.float64)
+        ax = self._get_ax((10, 6))
+        ax.plot(x_values, y_values, marker='o', rasterized=True)
+        ax.set_title(title)
+        ax.set_xlabel(x_label)
+        ax.set_ylabel(y_label)
+        ax.grid(True, linestyle='--', alpha=0.7)
+        self._fig.tight_layout()
+
         # Save the chart
         output_path = os.path.join(self.output_dir, filename)
-        plt.savefig(output_path)
-        plt.close()
-        
+        self._fig.savefig(output_path, dpi=72, bbox_inches="tight")
+
         return output_path
\ No newline at end of file